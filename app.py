@@ -18,6 +18,7 @@ from deploiement import (
     Arrete,
     Resolution
 )
+from deploiement.memoire import CACHE_PARTAGE
 
 class Application:
     def __init__(self):
@@ -151,7 +152,8 @@ class Application:
                 str(self.zone_entree_h_supp.value/100)
             )       
             solution = Resolution(
-                grapheD=GrapheD(probleme=probleme)
+                grapheD=GrapheD(probleme=probleme),
+                cache=CACHE_PARTAGE
             )
         except ValueError:
             probleme = None
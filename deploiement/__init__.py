@@ -65,34 +65,63 @@ Exemple :
     La commande python -m deploiement permettra d'afficher un exemple.
 """
 
-from .probleme import (
-    Mois,
-    Employes,
-    Inf,
-    Cout,
-    Couts,
-    Prerequis,
-    Echange,
-    Probleme
-)
-from .modelisation import (
-    GrapheD,
-    Sommet,
-    Arrete
-)
-from .resolution import Resolution
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-__all__ = [
-    "Mois",
-    "Employes",
-    "Inf",
-    "Cout",
-    "Couts",
-    "Prerequis",
-    "Echange",
-    "Probleme",
-    "GrapheD",
-    "Sommet",
-    "Arrete",
-    "Resolution"
-]
\ No newline at end of file
+if TYPE_CHECKING:
+    from .probleme import (
+        Mois,
+        Employes,
+        Inf,
+        Cout,
+        Couts,
+        Prerequis,
+        Echange,
+        Probleme,
+        ProblemeCompile
+    )
+    from .modelisation import (
+        GrapheD,
+        Sommet,
+        Arrete,
+        Faisabilite
+    )
+    from .resolution import Resolution, Solution, Arrivees, Departs, Encadrement
+
+_MODULES = {
+    "Mois": ".probleme",
+    "Employes": ".probleme",
+    "Inf": ".probleme",
+    "Cout": ".probleme",
+    "Couts": ".probleme",
+    "Prerequis": ".probleme",
+    "Echange": ".probleme",
+    "Probleme": ".probleme",
+    "ProblemeCompile": ".probleme",
+    "GrapheD": ".modelisation",
+    "Sommet": ".modelisation",
+    "Arrete": ".modelisation",
+    "Faisabilite": ".modelisation",
+    "Resolution": ".resolution",
+    "Solution": ".resolution",
+    "Arrivees": ".resolution",
+    "Departs": ".resolution",
+    "Encadrement": ".resolution"
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(nom: str):
+    """Importe à la demande le module qui définit un nom exporté (PEP 562) :
+    import deploiement ne charge ni numpy, ni rich, ni matplotlib, ni networkx."""
+    if nom not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {nom!r}")
+    valeur = getattr(import_module(_MODULES[nom], __name__), nom)
+    globals()[nom] = valeur
+    return valeur
+
+
+def __dir__():
+    """Noms exportés, y compris ceux qui ne sont pas encore importés."""
+    return sorted(set(globals()) | set(__all__))
@@ -1,24 +1,27 @@
 """Description.
 
-Démonstration du module.
+Interface en ligne de commande du module.
+
+Sans argument, depuis un terminal, python -m deploiement affiche la démonstration.
+Sinon les problèmes sont lus au fil de l'eau dans des fichiers JSONL ou CSV, ou sur l'entrée standard,
+résolus par lots et les résultats écrits au fur et à mesure, en JSONL ou en CSV :
+
+    $ python -m deploiement scenarios.jsonl --jobs 8 --moteur dp --stats > resultats.jsonl
+    $ cat scenarios.csv | python -m deploiement --format-entree csv --format csv
+
+Une ligne JSONL est le dictionnaire de Probleme.vers_dict, avec éventuellement une clé "id".
+Un fichier CSV a les colonnes personnel, echange, couts, h_supp au format de Probleme.par_str
+(les prérequis séparés par des retours à la ligne ou des ";") et éventuellement une colonne id.
 """
 
-from .modelisation import (
-    GrapheD,
-    Sommet,
-    Arrete
-)
-from .probleme import (
-    Mois,
-    Employes,
-    Inf,
-    Cout,
-    Couts,
-    Prerequis,
-    Echange,
-    Probleme
-)
-from .resolution import Resolution
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
+from collections import Counter, deque
+from time import perf_counter
+import argparse
+import csv
+import json
+import os
+import sys
 
 personnel_str = """
 Février / 3 / Inf
@@ -37,14 +40,171 @@ h_supp_str = """
 .25
 """
 
-mon_probleme = Probleme.par_str(
-    personnel_str, 
-    echange_str,
-    couts_str,
-    h_supp_str
-)
-mon_probleme.affiche()
-
-solution = Resolution(GrapheD(mon_probleme))
-solution.affiche()
-solution.genere_graphique()
\ No newline at end of file
+COLONNES_ENTREE = ("personnel", "echange", "couts", "h_supp")
+COLONNES_SORTIE = ("id", "statut", "cout_total", "employes", "erreur")
+PERIODE_FLUSH = 1000
+
+
+def demonstration():
+    """Résout et affiche le problème d'exemple."""
+    from .probleme import Probleme
+    from .modelisation import GrapheD
+    from .resolution import Resolution
+    mon_probleme = Probleme.par_str(
+        personnel_str,
+        echange_str,
+        couts_str,
+        h_supp_str
+    )
+    mon_probleme.affiche()
+    solution = Resolution(GrapheD(mon_probleme))
+    solution.affiche()
+    solution.genere_graphique()
+
+
+def lit_jsonl(fichier: TextIO, premier: int = 0) -> Iterator[Tuple[Any, Any]]:
+    """Lit les problèmes ligne à ligne : (identifiant, dictionnaire).
+    L'identifiant par défaut est le rang du problème, les lignes vides étant ignorées.
+    Une ligne invalide est transmise telle quelle pour être signalée comme invalide."""
+    lignes = (ligne for ligne in fichier if ligne.strip())
+    for indice, ligne in enumerate(lignes, start=premier):
+        try:
+            donnees = json.loads(ligne)
+        except ValueError:
+            yield indice, ligne
+            continue
+        yield (donnees.get("id", indice) if isinstance(donnees, dict) else indice), donnees
+
+
+def lit_csv(fichier: TextIO, premier: int = 0) -> Iterator[Tuple[Any, Tuple[str, str, str, str]]]:
+    """Lit les problèmes ligne à ligne : (identifiant, arguments de Probleme.par_str)."""
+    for indice, ligne in enumerate(csv.DictReader(fichier), start=premier):
+        personnel, echange, couts, h_supp = (ligne.get(colonne) or "" for colonne in COLONNES_ENTREE)
+        yield ligne.get("id") or indice, (personnel.replace(";", "\n"), echange, couts, h_supp)
+
+
+def lit_entrees(chemins: List[str], format_entree: Optional[str]) -> Iterator[Tuple[Any, Any]]:
+    """Enchaîne la lecture des fichiers donnés, '-' désignant l'entrée standard.
+    Le format est déduit de l'extension s'il n'est pas précisé (JSONL par défaut)."""
+    lus = 0
+    for chemin in chemins or ["-"]:
+        format_fichier = format_entree or ("csv" if chemin.lower().endswith(".csv") else "jsonl")
+        lecteur = lit_csv if format_fichier == "csv" else lit_jsonl
+        if chemin == "-":
+            fichier = sys.stdin
+        else:
+            fichier = open(chemin, encoding="utf-8", newline="" if format_fichier == "csv" else None)
+        try:
+            for identifiant, entree in lecteur(fichier, lus):
+                lus += 1
+                yield identifiant, entree
+        finally:
+            if fichier is not sys.stdin:
+                fichier.close()
+
+
+def vers_ligne(identifiant: Any, resultat: "ResultatLot") -> Dict[str, Any]:
+    """Ligne de sortie d'un résultat."""
+    solution = resultat.solution
+    return {
+        "id": identifiant,
+        "statut": resultat.statut,
+        "cout_total": None if solution is None else solution.cout_total,
+        "employes": None if solution is None else solution.employes.tolist(),
+        "erreur": resultat.erreur
+    }
+
+
+def execute(arguments: argparse.Namespace, sortie: TextIO, journal: TextIO) -> Counter:
+    """Résout les problèmes lus et écrit chaque résultat dès qu'il est disponible.
+    Seuls les problèmes en cours de résolution sont en mémoire."""
+    from .lot import resoudre_lot
+    identifiants = deque()
+
+    def entrees():
+        for identifiant, entree in lit_entrees(arguments.entrees, arguments.format_entree):
+            identifiants.append(identifiant)
+            yield entree
+
+    if arguments.format == "csv":
+        ecrivain = csv.DictWriter(sortie, fieldnames=COLONNES_SORTIE, lineterminator="\n")
+        ecrivain.writeheader()
+    statuts = Counter()
+    duree_resolution = 0.
+    debut = perf_counter()
+    for nombre, resultat in enumerate(resoudre_lot(entrees(), jobs=arguments.jobs, moteur=arguments.moteur, cache=arguments.cache), start=1):
+        ligne = vers_ligne(identifiants.popleft(), resultat)
+        if arguments.format == "csv":
+            employes = ligne["employes"]
+            ecrivain.writerow({**ligne, "employes": "" if employes is None else ";".join(map(str, employes))})
+        else:
+            sortie.write(json.dumps(ligne, ensure_ascii=False) + "\n")
+        if nombre % PERIODE_FLUSH == 0:
+            sortie.flush()
+        statuts[resultat.statut] += 1
+        if resultat.solution is not None:
+            duree_resolution += resultat.solution.duree
+    sortie.flush()
+    if arguments.stats:
+        duree = perf_counter() - debut
+        total = sum(statuts.values())
+        print(f"Problèmes : {total} ({', '.join(f'{statut} : {nombre}' for statut, nombre in sorted(statuts.items()))})", file=journal)
+        print(f"Durée : {duree:.3f} s, {total / duree if duree else 0:.1f} problèmes/s", file=journal)
+        if statuts["resolu"]:
+            print(f"Résolution moyenne : {1000 * duree_resolution / statuts['resolu']:.3f} ms", file=journal)
+    return statuts
+
+
+def analyse_arguments(arguments: Optional[List[str]] = None) -> argparse.Namespace:
+    """Arguments de la ligne de commande."""
+    from .moteurs import MOTEURS
+    analyseur = argparse.ArgumentParser(
+        prog = "python -m deploiement",
+        description = "Résout par lots des problèmes de déploiement de personnel lus en JSONL ou en CSV."
+    )
+    analyseur.add_argument("entrees", nargs="*", help="fichiers à lire, '-' ou rien pour l'entrée standard")
+    analyseur.add_argument("--format-entree", choices=("jsonl", "csv"), help="format des entrées (déduit de l'extension sinon)")
+    analyseur.add_argument("--format", choices=("jsonl", "csv"), default="jsonl", help="format des résultats")
+    analyseur.add_argument("-o", "--sortie", help="fichier des résultats (sortie standard sinon)")
+    analyseur.add_argument("--moteur", choices=list(MOTEURS), default="dp", help="moteur de résolution")
+    analyseur.add_argument("--jobs", type=int, default=1, help="nombre de processus (0 : un par cœur)")
+    analyseur.add_argument("--cache", help="base SQLite des solutions déjà calculées, partagée entre exécutions")
+    analyseur.add_argument("--stats", action="store_true", help="affiche un bilan sur la sortie d'erreur")
+    analyseur.add_argument("--profile", action="store_true", help="profile le processus principal avec cProfile")
+    return analyseur.parse_args(arguments)
+
+
+def main(arguments: Optional[List[str]] = None) -> int:
+    """Point d'entrée : démonstration depuis un terminal sans argument, traitement par lots sinon.
+    Si le lecteur de la sortie standard la ferme avant la fin (| head), le traitement s'arrête sans trace."""
+    if arguments is None and len(sys.argv) == 1 and sys.stdin.isatty():
+        demonstration()
+        return 0
+    arguments = analyse_arguments(arguments)
+    arguments.jobs = arguments.jobs or None
+    sortie = open(arguments.sortie, "w", encoding="utf-8", newline="") if arguments.sortie else sys.stdout
+    try:
+        if arguments.profile:
+            import cProfile
+            import pstats
+            profil = cProfile.Profile()
+            profil.enable()
+            execute(arguments, sortie, sys.stderr)
+            profil.disable()
+            pstats.Stats(profil, stream=sys.stderr).sort_stats("cumulative").print_stats(25)
+        else:
+            execute(arguments, sortie, sys.stderr)
+    except BrokenPipeError:
+        if sortie is not sys.stdout:
+            raise
+        # La sortie standard est redirigée vers /dev/null pour que son vidage à la sortie de Python n'échoue pas à nouveau.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        if sortie is not sys.stdout:
+            sortie.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""Description.
+
+Résolution hiérarchique des horizons longs à pas fin (semaines, jours).
+
+Le problème est d'abord agrégé par blocs de facteur périodes : le minimum d'une période agrégée
+est le plus grand des minimums du bloc, et les échanges autorisés comme les coûts d'effectif
+sont cumulés sur le bloc. Le plan grossier, interpolé période par période, trace un couloir
+de nombres d'employés et le problème fin n'est résolu que sur les sommets de ce couloir.
+Tant que le plan fin touche un bord du couloir qui n'est pas une borne des couches élaguées,
+ou qu'aucun plan ne tient dans le couloir, la largeur est doublée et le problème fin résolu à nouveau.
+
+Le plan obtenu est optimal parmi les plans du couloir final. Il n'est optimal sans réserve
+que lorsque ce couloir contient toutes les couches élaguées (Raffinement.complet) ;
+sinon le résultat est heuristique. Un plan fin qui ne touche pas les bords du couloir
+ne prouve rien : le coût de sur-effectif est un saut et la borne de suppression un arrondi,
+le coût n'est donc pas convexe et un meilleur plan peut passer entièrement hors du couloir.
+
+Exemple :
+
+    >>> len(probleme_journalier.mois), probleme_journalier.compile().plafond
+    (1100, 2678)
+    >>> raffinement = resout_hierarchique(probleme_journalier, facteur=30)
+    >>> raffinement.largeur, raffinement.elargissements, raffinement.complet
+    (450, 0, False)
+    >>> raffinement.solution.cout_total >= Resolution(GrapheD(probleme_journalier)).solution.cout_total  # égalité ici, sans garantie
+    True
+    >>> raffinement.solution.sommets_par_mois.sum()  # 2517869 sommets dans les couches élaguées
+    768578
+"""
+
+from typing import Optional, Tuple
+from dataclasses import dataclass
+from time import perf_counter
+import numpy as np
+from .probleme import Inf, Couts, Echange, Prerequis, Probleme
+from .modelisation import GrapheD
+from .moteurs import passe_arriere, _descend_chemin
+from .resolution import Resolution, Solution
+
+
+@dataclass(frozen=True)
+class Raffinement:
+    """Résultat d'une résolution hiérarchique : plan fin, plan grossier qui a guidé le couloir,
+    demi-largeur finale du couloir, nombre d'élargissements, et si le couloir final couvrait
+    toutes les couches élaguées. Seul un résultat complet est garanti optimal ;
+    sinon la solution est la meilleure du couloir, sans borne sur l'écart à l'optimum."""
+
+    solution: Optional[Solution]
+    grossiere: Optional[Solution]
+    largeur: int
+    elargissements: int
+    complet: bool
+
+
+def agrege(probleme: Probleme, facteur: int) -> Tuple[Probleme, np.ndarray]:
+    """Problème agrégé par blocs de facteur périodes, et indices des périodes fines qui le composent :
+    la première, une toutes les facteur périodes et la dernière, dont les prérequis sont conservés."""
+    if facteur < 1:
+        raise ValueError("Le facteur d'agrégation doit être au moins égal à 1.")
+    compile = probleme.compile()
+    indices = np.unique(np.r_[np.arange(0, len(compile.mois), facteur), len(compile.mois) - 1])
+    personnel = list(probleme.personnel)
+    agrege = [personnel[0]]
+    for debut, fin in zip(indices[:-2].tolist(), indices[1:-1].tolist()):
+        minimum = int(compile.min_pers[debut+1:fin+1].max())
+        maximum = max(compile.max_pers[debut+1:fin+1].min(), minimum)
+        agrege.append(Prerequis(compile.mois[fin], minimum, maximum if maximum == Inf else int(maximum)))
+    if len(indices) > 1:
+        agrege.append(personnel[-1])
+    # Le taux cumulé peut s'arrondir à 1 en flottant : il reste strictement inférieur à 1.
+    suppression_max = min(1 - (1 - compile.suppression_max) ** facteur, np.nextafter(1., 0.))
+    echange = Echange(compile.ajout_max * facteur, suppression_max)
+    couts = Couts(compile.changement, compile.sur_effectif * facteur, compile.sous_effectif * facteur)
+    return Probleme(agrege, echange, couts, compile.h_supp), indices
+
+
+def resout_hierarchique(probleme: Probleme, facteur: int, largeur: Optional[int] = None, moteur: str = "dp") -> Raffinement:
+    """Résout le problème agrégé avec le moteur donné, puis le problème fin dans un couloir de demi-largeur
+    largeur autour du plan grossier (par défaut, l'ajout maximal sur un bloc), élargi jusqu'à ce que
+    le plan fin n'en touche plus les bords. Sans plan grossier, le couloir suit la droite du départ à l'arrivée.
+    Le plan renvoyé n'est garanti optimal que si Raffinement.complet est vrai."""
+    debut = perf_counter()
+    grapheD = GrapheD(probleme)
+    compile = grapheD._compile
+    grossier, indices = agrege(probleme, facteur)
+    grossiere = Resolution(GrapheD(grossier), moteur = moteur).solution
+    if not grapheD.faisabilite().resolvable:
+        return Raffinement(None, grossiere, 0, 0, True)
+    bas, haut = grapheD._intervalles(elague=True)
+    periodes = np.arange(len(compile.mois))
+    if grossiere is None:
+        centre = np.interp(periodes, [0, periodes[-1]], [compile.depart, compile.arrivee])
+    else:
+        centre = np.interp(periodes, indices, grossiere.employes)
+    largeur = max(1, int(np.ceil(compile.ajout_max * facteur))) if largeur is None else largeur
+    if largeur < 1:
+        raise ValueError("La largeur du couloir doit être au moins égale à 1.")
+    elargissements = 0
+    while True:
+        bas_couloir = np.maximum(bas, np.floor(centre - largeur).astype(np.int64))
+        haut_couloir = np.minimum(haut, np.ceil(centre + largeur).astype(np.int64))
+        complet = bool((bas_couloir == bas).all() and (haut_couloir == haut).all())
+        if (bas_couloir <= haut_couloir).all():
+            couches = [np.arange(minimum, maximum+1) for minimum, maximum in zip(bas_couloir.tolist(), haut_couloir.tolist())]
+            tables = passe_arriere(grapheD, couches)
+            if np.isfinite(tables.valeurs[0][0]):
+                employes = _descend_chemin(tables, 0)
+                touche = ((employes == bas_couloir) & (bas_couloir > bas)) | ((employes == haut_couloir) & (haut_couloir < haut))
+                if complet or not touche.any():
+                    resolution = Resolution(grapheD)
+                    solution = resolution._construit_solution(employes, debut, couches)
+                    return Raffinement(solution, grossiere, largeur, elargissements, complet)
+        if complet:
+            return Raffinement(None, grossiere, largeur, elargissements, complet)
+        largeur *= 2
+        elargissements += 1
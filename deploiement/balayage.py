@@ -0,0 +1,150 @@
+"""Description.
+
+Balayage vectorisé des paramètres de coûts d'un problème de déploiement.
+
+Les couches de sommets ne dépendent que des effectifs et des échanges autorisés :
+toutes les variantes de coûts partagent donc le même graphe, et la programmation
+dynamique mois par mois est menée sur un axe supplémentaire portant les variantes.
+
+Exemple :
+
+    >>> balayage = balaye(probleme, changement=range(100, 305, 5), h_supp=[.1, .2, .25])
+    >>> balayage.couts.shape
+    (41, 1, 1, 3)
+    >>> balayage.plan(20, 0, 0, 2)
+    array([3, 4, 5, 5, 5])
+"""
+
+from typing import Dict, Iterable, Optional, Tuple
+from dataclasses import dataclass
+from itertools import product
+import numpy as np
+from .probleme import Probleme
+from .modelisation import GrapheD
+
+PARAMETRES = ("changement", "sur_effectif", "sous_effectif", "h_supp")
+
+
+@dataclass(frozen=True)
+class Balayage:
+    """Résultat d'un balayage : un axe par paramètre, dans l'ordre de PARAMETRES.
+
+    couts[i, j, k, l] est le coût optimal de la variante correspondante (inf sans solution)
+    et employes[i, j, k, l] le nombre d'employés de chaque mois du plan optimal.
+    """
+
+    parametres: Dict[str, np.ndarray]
+    couts: np.ndarray
+    employes: Optional[np.ndarray]
+
+    def plan(self, *indices: int) -> Optional[np.ndarray]:
+        """Plan optimal de la variante d'indices donnés sur chaque axe."""
+        if self.employes is not None:
+            return self.employes[indices]
+
+
+def _minimums_fenetres(valeurs: np.ndarray, debut: np.ndarray, fin: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Minimum et position du minimum de valeurs[:, debut[i]:fin[i]+1] pour chaque fenêtre i.
+
+    valeurs porte les variantes sur son premier axe. Une table creuse des positions des minimums
+    sur les fenêtres de taille 2^k répond à chaque requête par la comparaison de deux fenêtres ;
+    les requêtes sont traitées par groupes de même k, sans boucle sur les variantes.
+    """
+    nb_variantes, taille = valeurs.shape
+    minimums = np.full((nb_variantes, len(debut)), np.inf)
+    positions = np.full((nb_variantes, len(debut)), -1)
+    longueurs = fin - debut + 1
+    valides = (longueurs > 0) & (taille > 0)
+    if not valides.any():
+        return minimums, positions
+    niveaux = [np.broadcast_to(np.arange(taille), valeurs.shape)]
+    while 2 ** len(niveaux) <= taille:
+        largeur = 2 ** (len(niveaux)-1)
+        gauche, droite = niveaux[-1][:, :-largeur], niveaux[-1][:, largeur:]
+        niveaux.append(
+            np.where(
+                np.take_along_axis(valeurs, droite, axis=1) < np.take_along_axis(valeurs, gauche, axis=1),
+                droite,
+                gauche
+            )
+        )
+    k = np.zeros(len(debut), dtype=int)
+    k[valides] = np.floor(np.log2(longueurs[valides])).astype(int)
+    for niveau in np.unique(k[valides]).tolist():
+        requetes = np.flatnonzero(valides & (k == niveau))
+        gauche = niveaux[niveau][:, debut[requetes]]
+        droite = niveaux[niveau][:, fin[requetes] - 2 ** niveau + 1]
+        valeurs_gauche = np.take_along_axis(valeurs, gauche, axis=1)
+        valeurs_droite = np.take_along_axis(valeurs, droite, axis=1)
+        a_droite = valeurs_droite < valeurs_gauche
+        minimums[:, requetes] = np.where(a_droite, valeurs_droite, valeurs_gauche)
+        positions[:, requetes] = np.where(a_droite, droite, gauche)
+    return minimums, positions
+
+
+def _cout_couches(grapheD: GrapheD, indice_mois: int, employes: np.ndarray, variantes: Dict[str, np.ndarray]) -> np.ndarray:
+    """Coût de sous-effectif ou de sur-effectif de chaque variante (lignes) et de chaque effectif (colonnes)."""
+    compile = grapheD._compile
+    minimum = compile.min_pers[indice_mois]
+    manque = minimum - (1 + variantes["h_supp"][:, None]) * employes
+    sous_effectif = employes < minimum
+    cout = np.where(sous_effectif & (manque > 0), variantes["sous_effectif"][:, None] * manque, 0)
+    return np.where(
+        ~sous_effectif & (employes > compile.max_pers[indice_mois]),
+        cout + variantes["sur_effectif"][:, None],
+        cout
+    )
+
+
+def balaye(
+    probleme: Probleme,
+    changement: Optional[Iterable[float]] = None,
+    sur_effectif: Optional[Iterable[float]] = None,
+    sous_effectif: Optional[Iterable[float]] = None,
+    h_supp: Optional[Iterable[float]] = None
+) -> Balayage:
+    """Résout toutes les combinaisons de paramètres en une seule passe vectorisée.
+    Un paramètre non renseigné garde la valeur du problème."""
+    compile = probleme.compile()
+    axes = {
+        nom: np.array([getattr(compile, nom)] if valeurs is None else list(valeurs), dtype=float)
+        for nom, valeurs in zip(PARAMETRES, (changement, sur_effectif, sous_effectif, h_supp))
+    }
+    for nom, valeurs in axes.items():
+        if (valeurs < 0).any():
+            raise ValueError(f"Le paramètre {nom} doit être positif.")
+    forme = tuple(len(valeurs) for valeurs in axes.values())
+    grille = np.array(list(product(*axes.values()))).reshape(-1, len(PARAMETRES))
+    variantes = {nom: grille[:, indice] for indice, nom in enumerate(PARAMETRES)}
+    grapheD = GrapheD(probleme)
+    if not grapheD.faisabilite().resolvable:
+        return Balayage(axes, np.full(forme, np.inf), None)
+    changements = variantes["changement"][:, None]
+    couches = grapheD._genere_couches(elague=True)
+    valeurs = np.zeros((len(grille), len(couches[0])))
+    choix = []
+    for indice_mois in range(1, len(couches)):
+        precedente, couche = couches[indice_mois-1], couches[indice_mois]
+        bas_precedente, _ = grapheD._bande(precedente)
+        debut_ajout = np.searchsorted(precedente, couche - compile.ajout_max, side="left")
+        fin_ajout = np.searchsorted(precedente, couche, side="right") - 1
+        fin_suppression = np.searchsorted(bas_precedente, couche, side="right") - 1
+        min_ajout, pos_ajout = _minimums_fenetres(valeurs - changements * precedente, debut_ajout, fin_ajout)
+        min_suppression, pos_suppression = _minimums_fenetres(valeurs + changements * precedente, fin_ajout + 1, fin_suppression)
+        par_ajout = min_ajout + changements * couche
+        par_suppression = min_suppression - changements * couche
+        choix.append(np.where(par_suppression < par_ajout, pos_suppression, pos_ajout).astype(np.int32))
+        valeurs = np.minimum(par_ajout, par_suppression) + _cout_couches(grapheD, indice_mois, couche, variantes)
+    indices = np.full(len(grille), np.searchsorted(couches[-1], compile.arrivee))
+    employes = np.empty((len(grille), len(couches)), dtype=np.int64)
+    employes[:, -1] = couches[-1][indices]
+    for indice_mois in range(len(couches)-1, 0, -1):
+        indices = choix[indice_mois-1][np.arange(len(grille)), indices]
+        employes[:, indice_mois-1] = couches[indice_mois-1][indices]
+    couts = np.zeros(len(grille))
+    for indice_mois in range(1, len(couches)):
+        couts += (
+            np.abs(employes[:, indice_mois] - employes[:, indice_mois-1]) * variantes["changement"]
+            + _cout_couches(grapheD, indice_mois, employes[:, indice_mois, None], variantes)[:, 0]
+        )
+    return Balayage(axes, couts.reshape(forme), employes.reshape(forme + (len(couches),)))
@@ -0,0 +1,145 @@
+"""Description.
+
+Cache persistant des solutions sur disque, dans une base SQLite.
+
+La clé d'une solution est l'empreinte du problème complet, le moteur et VERSION :
+une solution retrouvée est renvoyée sans construire de GrapheD. La base est ouverte
+en mode WAL avec un délai d'attente, chaque processus d'un pool ayant sa propre connexion ;
+au-delà de taille_max entrées, les moins récemment utilisées sont supprimées.
+
+Exemple :
+
+    >>> cache = CacheSolutions("solutions.sqlite", taille_max=100_000)
+    >>> cache.resout(probleme).cout_total
+    790.0
+    >>> list(resoudre_lot(problemes, jobs=8, cache="solutions.sqlite"))
+"""
+
+from typing import Optional, Tuple
+from hashlib import sha256
+from time import time
+import json
+import os
+import sqlite3
+import numpy as np
+from .probleme import Probleme
+from .modelisation import GrapheD
+from .resolution import Resolution, Solution
+
+VERSION = 1
+DELAI = 30.
+PERIODE_EVICTION = 64
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS solutions (
+    cle TEXT PRIMARY KEY,
+    employes TEXT,
+    couts TEXT,
+    sommets_par_mois TEXT,
+    duree REAL,
+    acces REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS solutions_acces ON solutions (acces);
+"""
+
+
+class CacheSolutions:
+    """Cache SQLite des solutions, partagé par plusieurs processus.
+    Un problème sans solution est aussi conservé, pour ne pas être résolu à nouveau."""
+
+    def __init__(self, chemin: str, taille_max: int = 100_000, delai: float = DELAI):
+        """Initialisation. La connexion n'est ouverte qu'au premier accès, dans le processus qui l'utilise."""
+        if taille_max < 1:
+            raise ValueError("La taille du cache doit être au moins égale à 1.")
+        self.chemin = chemin
+        self.taille_max = taille_max
+        self.delai = delai
+        self._connexion: Optional[sqlite3.Connection] = None
+        self._processus: Optional[int] = None
+        self._ecritures = 0
+
+    def __repr__(self) -> str:
+        """Affichage."""
+        return f"CacheSolutions(chemin = {self.chemin!r}, taille_max = {self.taille_max})"
+
+    @property
+    def connexion(self) -> sqlite3.Connection:
+        """Connexion propre au processus courant : une connexion héritée d'un fork n'est pas réutilisée."""
+        if self._connexion is None or self._processus != os.getpid():
+            self._connexion = sqlite3.connect(self.chemin, timeout=self.delai, isolation_level=None)
+            self._connexion.execute("PRAGMA journal_mode=WAL")
+            self._connexion.execute("PRAGMA synchronous=NORMAL")
+            self._connexion.executescript(SCHEMA)
+            self._processus = os.getpid()
+        return self._connexion
+
+    def ferme(self):
+        """Ferme la connexion du processus courant."""
+        if self._connexion is not None and self._processus == os.getpid():
+            self._connexion.close()
+        self._connexion = None
+
+    @staticmethod
+    def cle(probleme: Probleme, moteur: str) -> str:
+        """Clé d'une solution : empreinte du problème, moteur et version du cache."""
+        return sha256(f"{probleme.empreinte}:{moteur}:{VERSION}".encode()).hexdigest()
+
+    def __len__(self) -> int:
+        """Nombre de solutions conservées."""
+        return self.connexion.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    def lit(self, probleme: Probleme, moteur: str = "dp") -> Tuple[bool, Optional[Solution]]:
+        """Renvoie (trouvée, solution) ; la solution vaut None pour un problème sans solution."""
+        cle = self.cle(probleme, moteur)
+        ligne = self.connexion.execute(
+            "SELECT employes, couts, sommets_par_mois, duree FROM solutions WHERE cle = ?", (cle,)
+        ).fetchone()
+        if ligne is None:
+            return False, None
+        self.connexion.execute("UPDATE solutions SET acces = ? WHERE cle = ?", (time(), cle))
+        employes, couts, sommets_par_mois, duree = ligne
+        if employes is None:
+            return True, None
+        couts = np.array(json.loads(couts))
+        return True, Solution(
+            mois = tuple(probleme.mois),
+            employes = np.array(json.loads(employes)),
+            couts = couts,
+            couts_cumules = np.cumsum(couts),
+            sommets_par_mois = np.array(json.loads(sommets_par_mois)),
+            duree = duree
+        )
+
+    def ecrit(self, probleme: Probleme, moteur: str, solution: Optional[Solution]):
+        """Conserve la solution d'un problème, puis supprime périodiquement les entrées en trop."""
+        if solution is None:
+            valeurs = (None, None, None, None)
+        else:
+            valeurs = (
+                json.dumps(solution.employes.tolist()),
+                json.dumps(solution.couts.tolist()),
+                json.dumps(solution.sommets_par_mois.tolist()),
+                solution.duree
+            )
+        self.connexion.execute(
+            "INSERT OR REPLACE INTO solutions VALUES (?, ?, ?, ?, ?, ?)",
+            (self.cle(probleme, moteur), *valeurs, time())
+        )
+        self._ecritures += 1
+        if self._ecritures % PERIODE_EVICTION == 0 or self.taille_max < PERIODE_EVICTION:
+            self.evince()
+
+    def evince(self):
+        """Supprime les entrées les moins récemment utilisées au-delà de taille_max."""
+        self.connexion.execute(
+            "DELETE FROM solutions WHERE cle IN (SELECT cle FROM solutions ORDER BY acces DESC LIMIT -1 OFFSET ?)",
+            (self.taille_max,)
+        )
+
+    def resout(self, probleme: Probleme, moteur: str = "dp") -> Optional[Solution]:
+        """Solution du cache si elle existe, sinon résolue puis conservée."""
+        trouvee, solution = self.lit(probleme, moteur)
+        if not trouvee:
+            solution = Resolution(GrapheD(probleme), moteur=moteur).solution
+            self.ecrit(probleme, moteur, solution)
+        return solution
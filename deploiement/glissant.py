@@ -0,0 +1,126 @@
+"""Description.
+
+Planification glissante : chaque mois, le premier mois du plan devient l'historique
+et une nouvelle prévision arrive.
+
+PlanGlissant conserve les tables de la passe arrière, c'est-à-dire le coût optimal restant
+depuis chaque sommet jusqu'à l'arrivée, qui ne dépendent pas du départ. Avancer d'un mois
+reprend telles quelles les tables des mois suivants : le nouveau plan optimal est relu
+en O(nombre de mois), sans relaxation, y compris si l'effectif réalisé s'écarte du plan.
+Une prévision révisée sur des mois intermédiaires ne recalcule que les mois qui les précèdent,
+jusqu'à ce que les tables ne changent plus qu'à une constante près. Seule une nouvelle arrivée
+(mois ajoutés ou dernier mois modifié) impose une passe arrière complète.
+
+Exemple :
+
+    >>> plan = PlanGlissant(probleme)  # de Février à Septembre, voir Resolution
+    >>> plan.solution.employes
+    array([3, 4, 5, 5, 5, 5, 4, 3])
+    >>> plan.avance().employes
+    array([4, 5, 5, 5, 5, 4, 3])
+    >>> plan.avance(effectif = 7).employes
+    array([7, 7, 7, 5, 4, 3])
+    >>> plan.prevoit(Prerequis("Juillet", 8, Inf)).employes
+    array([7, 7, 7, 6, 4, 3])
+    >>> plan.prevoit(Prerequis("Septembre", 3, Inf), Prerequis("Octobre", 5, 5)).employes
+    array([7, 7, 7, 7, 7, 7, 5])
+"""
+
+from typing import Optional
+from time import perf_counter
+import numpy as np
+from .probleme import Employes, Prerequis, Probleme
+from .modelisation import GrapheD
+from .moteurs import Tables, passe_arriere, passe_departs, met_a_jour_arriere, _descend_chemin
+from .resolution import Resolution, Solution
+
+
+class PlanGlissant:
+    """Plan de déploiement tenu à jour mois après mois, toujours optimal pour la prévision courante."""
+
+    def __init__(self, probleme: Probleme):
+        """Initialisation : une passe arrière complète sur le problème initial."""
+        self._grapheD = GrapheD(probleme)
+        self._tables = passe_departs(self._grapheD, self._grapheD._compile.depart, self._grapheD._compile.depart)
+        self._resolution: Optional[Resolution] = None
+
+    def __repr__(self) -> str:
+        """Affichage."""
+        return f"PlanGlissant(mois = {list(self._grapheD._compile.mois)})"
+
+    @property
+    def probleme(self) -> Probleme:
+        """Problème courant : le premier mois est le mois en cours, son minimum l'effectif réalisé."""
+        return self._grapheD._probleme
+
+    @property
+    def resolution(self) -> Resolution:
+        """Résolution du problème courant, dont la solution est lue dans les tables conservées."""
+        if self._resolution is None:
+            debut = perf_counter()
+            resolution = Resolution(self._grapheD)
+            couche, valeurs = self._tables.couches[0], self._tables.valeurs[0]
+            indice = self._grapheD._compile.depart - couche[0]
+            if 0 <= indice < len(couche) and np.isfinite(valeurs[indice]):
+                resolution._solution = resolution._construit_solution(_descend_chemin(self._tables, indice), debut)
+            resolution._est_resolu = True
+            self._resolution = resolution
+        return self._resolution
+
+    @property
+    def solution(self) -> Optional[Solution]:
+        """Plan optimal pour la prévision courante, None si l'arrivée n'est pas atteignable."""
+        return self.resolution.solution
+
+    def avance(self, effectif: Optional[Employes] = None) -> Optional[Solution]:
+        """Le premier mois devient l'historique : le plan démarre au mois suivant avec l'effectif réalisé,
+        par défaut celui que prévoyait le plan. Renvoie le nouveau plan optimal.
+
+        Les tables des mois suivants sont reprises si l'effectif réalisé fait partie des effectifs
+        qu'elles couvrent ; sinon, par exemple après des départs imprévus, elles sont recalculées."""
+        probleme = self.probleme
+        if len(probleme.mois) < 3:
+            raise ValueError("Il faut au moins trois mois pour avancer d'un mois.")
+        if effectif is None:
+            if self.solution is None:
+                raise ValueError("Le problème n'a pas de solution : il faut indiquer l'effectif réalisé.")
+            effectif = int(self.solution.employes[1])
+        personnel = list(probleme.personnel)[1:]
+        # Le coût du premier mois n'est jamais compté : son maximum suit l'effectif réalisé s'il le dépasse.
+        personnel[0] = Prerequis(personnel[0].mois, effectif, max(personnel[0].nb_employes_max, effectif))
+        self._grapheD = GrapheD(Probleme(personnel, probleme._echange, probleme._couts, probleme._h_supp))
+        tables = self._tables
+        if tables.couches[1][0] <= effectif <= tables.couches[1][-1]:
+            self._tables = Tables(tables.couches[1:], tables.valeurs[1:], tables.choix[1:])
+        else:
+            self._tables = passe_departs(self._grapheD, effectif, effectif)
+        self._resolution = None
+        return self.solution
+
+    def prevoit(self, *prerequis: Prerequis) -> Optional[Solution]:
+        """Met à jour la prévision et renvoie le nouveau plan optimal.
+        Les prérequis d'un mois déjà prévu le remplacent, les autres sont ajoutés à la fin dans l'ordre donné ;
+        le dernier mois doit toujours avoir un nombre d'employés imposé."""
+        probleme = self.probleme
+        mois = probleme.mois
+        prevision = {prerequis_mois.mois: prerequis_mois for prerequis_mois in prerequis}
+        if mois[0] in prevision:
+            raise ValueError(f"{mois[0]} est le mois en cours : son effectif ne change qu'avec avance.")
+        anciens = list(probleme.personnel)
+        personnel = [prevision.pop(ancien.mois, ancien) for ancien in anciens] + list(prevision.values())
+        grapheD = GrapheD(Probleme(personnel, probleme._echange, probleme._couts, probleme._h_supp))
+        tables = self._tables
+        bas, haut = grapheD._intervalles_avant((int(tables.couches[0][0]), int(tables.couches[0][-1])))
+        couches = [np.arange(debut, fin+1) for debut, fin in zip(bas.tolist(), haut.tolist())]
+        if len(personnel) == len(anciens) and personnel[-1] == anciens[-1] and all(
+            len(couche) == len(ancienne) and couche[0] == ancienne[0]
+            for couche, ancienne in zip(couches, tables.couches)
+        ):
+            for indice_mois in range(len(personnel)-2, 0, -1):
+                if personnel[indice_mois] != anciens[indice_mois]:
+                    tables = met_a_jour_arriere(grapheD, tables, indice_mois)
+        else:
+            tables = passe_arriere(grapheD, couches)
+        self._grapheD, self._tables = grapheD, tables
+        self._resolution = None
+        return self.solution
@@ -0,0 +1,141 @@
+"""Description.
+
+Résolution par lots de problèmes de déploiement sur un pool de processus.
+
+Exemple :
+
+    >>> from deploiement.lot import resoudre_lot
+    >>> resultats = list(resoudre_lot(problemes, jobs=8))
+    >>> [resultat.statut for resultat in resultats]
+    ['resolu', 'sans_solution', 'invalide', ...]
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Tuple, Optional, Union
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+from functools import lru_cache
+from itertools import islice
+from time import perf_counter
+import json
+import os
+from .probleme import Probleme
+from .modelisation import GrapheD
+from .resolution import Resolution, Solution
+from .cache import CacheSolutions
+
+EntreeLot = Union[Probleme, Tuple[str, str, str, str], Dict[str, Any], str]
+
+DUREE_BLOC = 0.05
+TAILLE_BLOC_MAX = 256
+
+
+@dataclass(frozen=True)
+class ResultatLot:
+    """Résultat de la résolution d'un problème d'un lot.
+
+    statut vaut 'resolu', 'sans_solution' (arrivée non atteignable), 'invalide'
+    (données incorrectes) ou 'erreur' (toute autre exception, décrite dans erreur).
+    """
+
+    indice: int
+    statut: str
+    solution: Optional[Solution] = None
+    erreur: Optional[str] = None
+
+
+def _lit_entree(entree: EntreeLot) -> Probleme:
+    """Construit le problème d'une entrée : objet Probleme, tuple pour Probleme.par_str,
+    dictionnaire pour Probleme.par_dict ou document JSON d'un tel dictionnaire."""
+    if isinstance(entree, Probleme):
+        return entree
+    if isinstance(entree, str):
+        entree = json.loads(entree)
+    if isinstance(entree, dict):
+        return Probleme.par_dict(entree)
+    return Probleme.par_str(*entree)
+
+
+@lru_cache(maxsize=None)
+def _ouvre_cache(chemin: str) -> CacheSolutions:
+    """Cache SQLite du chemin donné, ouvert une seule fois par processus."""
+    return CacheSolutions(chemin)
+
+
+def _resout_un(indice: int, entree: EntreeLot, moteur: str, cache: Optional[str] = None) -> ResultatLot:
+    """Résout un problème en conservant l'erreur éventuelle au lieu de la propager.
+    Avec un cache, une solution déjà conservée est renvoyée sans construire de GrapheD."""
+    try:
+        probleme = _lit_entree(entree)
+    except Exception as erreur:
+        return ResultatLot(indice, "invalide", erreur=f"{type(erreur).__name__}: {erreur}")
+    try:
+        if cache is None:
+            solution = Resolution(GrapheD(probleme), moteur=moteur).solution
+        else:
+            solution = _ouvre_cache(cache).resout(probleme, moteur)
+    except Exception as erreur:
+        return ResultatLot(indice, "erreur", erreur=f"{type(erreur).__name__}: {erreur}")
+    if solution is None:
+        return ResultatLot(indice, "sans_solution")
+    return ResultatLot(indice, "resolu", solution=solution)
+
+
+def _resout_bloc(bloc: List[Tuple[int, EntreeLot]], moteur: str, cache: Optional[str] = None) -> Tuple[List[ResultatLot], float]:
+    """Résout un bloc de problèmes dans un processus du pool et mesure sa durée."""
+    debut = perf_counter()
+    resultats = [_resout_un(indice, entree, moteur, cache) for indice, entree in bloc]
+    return resultats, perf_counter() - debut
+
+
+def resoudre_lot(
+    problemes: Iterable[EntreeLot],
+    jobs: Optional[int] = None,
+    moteur: str = "dp",
+    ordonne: bool = True,
+    cache: Optional[str] = None
+) -> Iterator[ResultatLot]:
+    """Résout un lot de problèmes sur jobs processus et renvoie les résultats au fil de l'eau.
+
+    Chaque problème est une entrée lue par _lit_entree : objet Probleme, tuple de quatre chaînes
+    pour Probleme.par_str, dictionnaire pour Probleme.par_dict ou ligne JSON d'un tel dictionnaire.
+    Le décodage a lieu dans les processus du pool.
+    Les résultats sont produits dans l'ordre des problèmes si ordonne, sinon dès qu'ils sont prêts.
+    La taille des blocs envoyés aux processus s'adapte à la durée mesurée des résolutions,
+    et le nombre de blocs en attente est borné : la mémoire ne dépend pas de la taille du lot.
+    cache est le chemin éventuel d'une base CacheSolutions partagée par tous les processus.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    entrees = enumerate(problemes)
+    if jobs == 1:
+        for indice, entree in entrees:
+            yield _resout_un(indice, entree, moteur, cache)
+        return
+    taille_bloc = 1
+    en_attente = 2 * jobs
+    prochain = 0
+    termines = {}
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        taches = set()
+        epuise = False
+        while True:
+            while not epuise and len(taches) + len(termines) // max(1, taille_bloc) < en_attente:
+                bloc = list(islice(entrees, taille_bloc))
+                if not bloc:
+                    epuise = True
+                    break
+                taches.add(pool.submit(_resout_bloc, bloc, moteur, cache))
+            if not taches:
+                break
+            faites, taches = wait(taches, return_when=FIRST_COMPLETED)
+            for tache in faites:
+                resultats, duree = tache.result()
+                par_probleme = duree / len(resultats)
+                if par_probleme > 0:
+                    taille_bloc = int(min(TAILLE_BLOC_MAX, max(1, DUREE_BLOC / par_probleme)))
+                if not ordonne:
+                    yield from resultats
+                    continue
+                termines.update((resultat.indice, resultat) for resultat in resultats)
+            while prochain in termines:
+                yield termines.pop(prochain)
+                prochain += 1
@@ -0,0 +1,100 @@
+"""Description.
+
+Cache en mémoire des solutions, partagé par Resolution et l'application.
+
+Les solutions sont indexées par l'empreinte du problème et le moteur, et les moins récemment
+utilisées sont oubliées au-delà de taille_max. Des demandes simultanées d'une même clé
+ne donnent lieu qu'à un seul calcul, dont le résultat est remis à chacune.
+
+Exemple :
+
+    >>> resolution = Resolution(GrapheD(probleme), cache=CACHE_PARTAGE)
+    >>> resolution.solution is Resolution(GrapheD(probleme), cache=CACHE_PARTAGE).solution
+    True
+"""
+
+from typing import Any, Callable, Dict, Hashable, Optional
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+import threading
+
+TAILLE_MAX = 256
+
+
+@dataclass
+class Statistiques:
+    """Compteurs d'utilisation d'un cache : solutions retrouvées, calculées ou attendues
+    pendant le calcul d'une autre demande."""
+
+    trouvees: int = 0
+    calculees: int = 0
+    attendues: int = 0
+
+
+class CacheMemoire:
+    """Cache LRU des solutions, sûr entre threads, avec un seul calcul par clé à la fois."""
+
+    def __init__(self, taille_max: int = TAILLE_MAX):
+        """Initialisation."""
+        if taille_max < 1:
+            raise ValueError("La taille du cache doit être au moins égale à 1.")
+        self.taille_max = taille_max
+        self.statistiques = Statistiques()
+        self._verrou = threading.Lock()
+        self._valeurs: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._en_cours: Dict[Hashable, Future] = {}
+
+    def __repr__(self) -> str:
+        """Affichage."""
+        return f"CacheMemoire(taille_max = {self.taille_max}, entrees = {len(self)})"
+
+    def __len__(self) -> int:
+        """Nombre de solutions conservées."""
+        return len(self._valeurs)
+
+    def __contains__(self, cle: Hashable) -> bool:
+        """Teste si une solution est conservée, sans la marquer comme utilisée."""
+        return cle in self._valeurs
+
+    def vide(self):
+        """Oublie toutes les solutions conservées."""
+        with self._verrou:
+            self._valeurs.clear()
+
+    def resout(self, cle: Hashable, calcule: Callable[[], Any]) -> Any:
+        """Renvoie la valeur conservée pour la clé, sinon la calcule une seule fois :
+        les demandes arrivant pendant le calcul en attendent le résultat.
+        Une exception est transmise à toutes ces demandes et rien n'est conservé."""
+        with self._verrou:
+            if cle in self._valeurs:
+                self._valeurs.move_to_end(cle)
+                self.statistiques.trouvees += 1
+                return self._valeurs[cle]
+            futur = self._en_cours.get(cle)
+            if futur is None:
+                futur = self._en_cours[cle] = Future()
+                self.statistiques.calculees += 1
+                calcul = True
+            else:
+                self.statistiques.attendues += 1
+                calcul = False
+        if not calcul:
+            return futur.result()
+        try:
+            valeur = calcule()
+        except BaseException as erreur:
+            with self._verrou:
+                del self._en_cours[cle]
+            futur.set_exception(erreur)
+            raise
+        with self._verrou:
+            self._valeurs[cle] = valeur
+            while len(self._valeurs) > self.taille_max:
+                self._valeurs.popitem(last=False)
+            del self._en_cours[cle]
+        futur.set_result(valeur)
+        return valeur
+
+
+CACHE_PARTAGE = CacheMemoire()
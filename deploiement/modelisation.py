@@ -3,9 +3,9 @@
 Modélisation du déploiement de personnel.
 """
 
-from typing import List, Tuple, Generator, Any, Union
-from math import floor
+from typing import List, Tuple, Generator, Any, Union, Optional
 from dataclasses import dataclass
+import numpy as np
 from .probleme import (
     Mois,
     Employes,
@@ -48,12 +48,65 @@ class Sommet:
     
     @classmethod
     def par_str(cls, message: str) -> "Sommet":
-        """Constructeur alternatif."""
-        mois = message.split()[0]
-        nb_employes = int(message.split()[2])
-        return cls(mois, nb_employes)
+        """Constructeur alternatif.
+        Le découpage se fait par la droite pour accepter les mois contenant des espaces."""
+        mois, _, nb_employes = message.rsplit(maxsplit=2)
+        return cls(mois, int(nb_employes))
 
 Arrete = Tuple[Sommet, Sommet, Union[int, float]]
+
+
+@dataclass
+class Faisabilite:
+    """Résultat du test de faisabilité d'un problème.
+    
+    bas et haut donnent, pour chaque mois, l'intervalle des nombres d'employés atteignables.
+    mois_bloquant est le premier mois dont l'objectif n'est pas atteignable, None sinon.
+    
+    Exemple :
+    
+    >>> GrapheD(probleme_sans_solution).faisabilite()
+    Faisabilite(resolvable=False, mois_bloquant='Mars', bas=array([3, 2]), haut=array([3, 6]))
+    """
+    
+    resolvable: bool
+    mois_bloquant: Optional[Mois]
+    bas: np.ndarray
+    haut: np.ndarray
+
+
+@dataclass
+class GrapheCSR:
+    """Graphe de déploiement sous forme de matrice creuse scipy au format CSR.
+    
+    Le sommet d'indice i correspond au mois d'indice mois[i] avec employes[i] employés.
+    Les sommets d'un même mois sont contigus et commencent à l'indice decalages[mois].
+    
+    Exemple :
+    
+    >>> graphe = GrapheD(probleme).exporte_csr()
+    >>> graphe.matrice
+    <Compressed Sparse Row sparse matrix of dtype 'float64'
+        with 12 stored elements and shape (8, 8)>
+    >>> graphe.indice(1, 3)
+    2
+    >>> graphe.mois[2], graphe.employes[2]
+    (1, 3)
+    """
+    
+    matrice: "csr_matrix"
+    mois: np.ndarray
+    employes: np.ndarray
+    decalages: np.ndarray
+    
+    def indice(self, indice_mois: int, nb_employes: int) -> int:
+        """Indice du sommet (indice du mois, nombre d'employés) dans la matrice."""
+        debut, fin = self.decalages[indice_mois], self.decalages[indice_mois+1]
+        indice = debut + nb_employes - (self.employes[debut] if fin > debut else 0)
+        if not debut <= indice < fin:
+            raise ValueError(f"Le sommet ({indice_mois}, {nb_employes}) n'appartient pas au graphe.")
+        return int(indice)
+
     
 class GrapheD:
     """Classe permettant la construction du graphe associé au problème de déploiement.
@@ -150,8 +203,9 @@ class GrapheD:
     """
     
     def __init__(self, probleme: Probleme):
-        """Initialisation à partir d'un objet de classe Probleme."""
+        """Initialisation à partir d'un objet de classe Probleme, compilé une seule fois."""
         self._probleme = probleme
+        self._compile = probleme.compile()
     
     @property
     def _inputs_graphe(self):
@@ -191,98 +245,207 @@ class GrapheD:
     
     def _recupere_indice_mois(self, mois_en_cours) -> int:
         """Récupère l'indice du mois en cours."""
-        mois = self._inputs_graphe[2]
-        for indice, mois in enumerate(mois):
-            if mois == mois_en_cours:
-                return indice        
+        return self._compile.indices.get(mois_en_cours)
+
+    def _intervalles_avant(self, depart: Optional[Tuple[int, int]] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Propage mois par mois l'intervalle des nombres d'employés atteignables depuis le départ.
+        L'union des bandes d'un intervalle est un intervalle : le calcul est en O(nombre de mois).
+        depart remplace, s'il est renseigné, le départ par un intervalle de nombres d'employés ;
+        le plafond est alors relevé à la borne haute de cet intervalle si elle le dépasse."""
+        compile = self._compile
+        bas = np.empty(len(compile.mois), dtype=np.int64)
+        haut = np.empty(len(compile.mois), dtype=np.int64)
+        bas[0], haut[0] = (compile.depart, compile.depart) if depart is None else depart
+        plafond = max(compile.plafond, haut[0])
+        for indice_mois in range(1, len(compile.mois)):
+            bas[indice_mois] = compile.bas(bas[indice_mois-1:indice_mois])[0]
+            haut[indice_mois] = min(haut[indice_mois-1] + compile.ajout_max, plafond)
+        return bas, haut
+
+    def _intervalles_arriere(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Propage à rebours l'intervalle des nombres d'employés depuis lesquels l'arrivée reste atteignable.
+        Depuis [a, b], le mois précédent peut compter entre a - ajout_max employés
+        et le plus grand effectif e tel que e - floor(e * suppression_max) <= b."""
+        compile = self._compile
+        bas = np.empty(len(compile.mois), dtype=np.int64)
+        haut = np.empty(len(compile.mois), dtype=np.int64)
+        bas[-1] = haut[-1] = compile.arrivee
+        for indice_mois in range(len(compile.mois)-2, -1, -1):
+            bas[indice_mois] = max(0, bas[indice_mois+1] - compile.ajout_max)
+            haut[indice_mois] = np.searchsorted(compile.bas_suppression, haut[indice_mois+1], side="right") - 1
+        return bas, haut
+
+    def _intervalles(self, elague: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """Bornes des couches de chaque mois : les effectifs atteignables depuis le départ et, avec elague,
+        depuis lesquels l'arrivée reste atteignable. Une couche est vide si sa borne basse dépasse sa borne haute.
+        Seule règle d'élagage, partagée par tous les moteurs."""
+        bas, haut = self._intervalles_avant()
+        if elague:
+            bas_arriere, haut_arriere = self._intervalles_arriere()
+            bas, haut = np.maximum(bas, bas_arriere), np.minimum(haut, haut_arriere)
+        return bas, haut
+
+    def faisabilite(self) -> Faisabilite:
+        """Teste si l'arrivée est atteignable sans construire aucune arrête."""
+        bas, haut = self._intervalles_avant()
+        arrivee = self._compile.arrivee
+        resolvable = len(bas) > 1 and bas[-1] <= arrivee <= haut[-1]
+        return Faisabilite(
+            resolvable = bool(resolvable),
+            mois_bloquant = None if resolvable else self._compile.mois[-1],
+            bas = bas,
+            haut = haut
+        )
+
+    def _genere_couches(self, elague: bool = False) -> List[np.ndarray]:
+        """Construit, pour chaque indice de mois, le tableau des nombres d'employés atteignables.
+        Un sommet est le couple (indice du mois, nombre d'employés) : les libellés ne servent qu'à l'affichage.
+        Avec elague, seuls les sommets depuis lesquels l'arrivée reste atteignable sont conservés."""
+        bas, haut = self._intervalles(elague)
+        return [
+            np.arange(employes_min, employes_max+1)
+            for employes_min, employes_max in zip(bas.tolist(), haut.tolist())
+        ]
+
+    def _bande(self, employes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Renvoie, pour chaque nombre d'employés, les bornes atteignables le mois suivant."""
+        return self._compile.bas(employes), employes + self._compile.ajout_max
+
+    def _cout_couche(self, indice_mois: int, employes: np.ndarray, minimum: Optional[int] = None, maximum: Optional[float] = None) -> np.ndarray:
+        """Coût de sous-effectif ou de sur-effectif de chaque nombre d'employés au mois donné.
+        minimum et maximum remplacent, s'ils sont renseignés, les prérequis du mois."""
+        compile = self._compile
+        minimum = compile.min_pers[indice_mois] if minimum is None else minimum
+        maximum = compile.max_pers[indice_mois] if maximum is None else maximum
+        manque = minimum - (1 + compile.h_supp) * employes
+        sous_effectif = employes < minimum
+        cout = np.where(sous_effectif & (manque > 0), compile.sous_effectif * manque, 0)
+        return np.where(
+            ~sous_effectif & (employes > maximum),
+            cout + compile.sur_effectif,
+            cout
+        )
+
+    def _cout_arrete(self, indice_mois_arr: int, employes_dep: np.ndarray, employes_arr: np.ndarray) -> np.ndarray:
+        """Coût des arrêtes arrivant au mois d'indice donné."""
+        return (
+            np.abs(employes_arr - employes_dep) * self._compile.changement
+            + self._cout_couche(indice_mois_arr, employes_arr)
+        )
+
+    def _etiquettes(self, indice_mois: int, employes: np.ndarray) -> List[str]:
+        """Libellés 'Mois - n' des sommets, utilisés uniquement pour l'affichage."""
+        mois = self._compile.mois[indice_mois]
+        return [mois + " - " + str(nb_employes) for nb_employes in employes.tolist()]
     
     def _genere_sommets(self) -> List[List["Sommet"]]:
         """Construit tous les sommets du graphe de déploiement de personnel."""
-        depart, _, mois, min_pers, _, echange, _, _ = self._inputs_graphe
-        sommets = [
-            [depart]
+        return [
+            self._etiquettes(indice_mois, couche)
+            for indice_mois, couche in enumerate(self._genere_couches())
         ]
-        for sommet in sommets:
-            sommet_min = Sommet.par_str(sommet[0])
-            sommet_max = Sommet.par_str(sommet[len(sommet)-1])
-            mois_en_cours = sommet_min.mois
-            if mois_en_cours == mois[-1]:
-                return sommets
+
+    def _arretes_couche(self, indice_mois_arr: int, precedente: np.ndarray, suivante: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Renvoie d'un bloc les tableaux (employés au départ, employés à l'arrivée, coût)
+        des arrêtes reliant deux couches consécutives, triées par départ puis par arrivée.
+        Chaque départ est relié à une plage contiguë de la couche suivante :
+        les arrêtes sont obtenues par arithmétique d'indices, sans parcours des paires."""
+        bas, haut = self._bande(precedente)
+        debut = np.searchsorted(suivante, bas, side="left")
+        nombres = np.maximum(np.searchsorted(suivante, haut, side="right") - debut, 0)
+        depart = np.repeat(precedente, nombres)
+        decalage = np.arange(len(depart)) - np.repeat(np.cumsum(nombres) - nombres, nombres)
+        arrivee = suivante[np.repeat(debut, nombres) + decalage]
+        return depart, arrivee, self._cout_arrete(indice_mois_arr, depart, arrivee)
+
+    def _arretes_couches(self, elague: bool = False, taille_bloc: Optional[int] = None) -> Generator[Tuple[int, np.ndarray, np.ndarray, np.ndarray], None, None]:
+        """Itère sur les blocs d'arrêtes : (indice du mois de départ, départs, arrivées, coûts).
+        Seules deux couches sont construites à la fois ; avec taille_bloc, les arrêtes d'une
+        même paire de mois sont découpées en blocs d'au plus taille_bloc arrêtes environ."""
+        bas, haut = self._intervalles(elague)
+        suivante = np.arange(bas[0], haut[0]+1)
+        for indice_mois in range(len(bas)-1):
+            precedente, suivante = suivante, np.arange(bas[indice_mois+1], haut[indice_mois+1]+1)
+            pas = len(precedente) if taille_bloc is None else max(1, taille_bloc // max(1, len(suivante)))
+            for debut in range(0, len(precedente), max(1, pas)):
+                yield (indice_mois, *self._arretes_couche(indice_mois+1, precedente[debut:debut+pas], suivante))
+
+    def genere_arretes(self, elague: bool = False, par_blocs: bool = False, taille_bloc: Optional[int] = None) -> Generator:
+        """Produit les arrêtes pondérées au fil de l'eau, mois par mois.
+        Par défaut, chaque arrête est un tuple ('Mois - n', 'Mois - n', coût) comme dans construit_graphe ;
+        avec par_blocs, des tuples de tableaux (indice du mois de départ, départs, arrivées, coûts).
+        La mémoire utilisée reste bornée par deux couches de sommets et un bloc d'arrêtes."""
+        mois = self._compile.mois
+        for indice_mois, depart, arrivee, couts in self._arretes_couches(elague, taille_bloc):
+            if par_blocs:
+                yield indice_mois, depart, arrivee, couts
             else:
-                indice_mois = self._recupere_indice_mois(mois_en_cours)
-                employes_max = sommet_max.nb_employes + echange.ajout_max
-                if employes_max > max(min_pers):
-                    employes_max = max(min_pers)
-                if floor(sommet_min.nb_employes * echange.suppression_max) >= 1:
-                    employes_min = sommet_min.nb_employes - floor(sommet_min.nb_employes * echange.suppression_max) 
-                else:
-                    employes_min = sommet_min.nb_employes
-                sommets.append(
-                    [
-                        mois[indice_mois+1] + " - " + str(k)
-                        for k in range(employes_min, employes_max+1)
-                    ]
-                )
-                   
+                etiquette_dep, etiquette_arr = mois[indice_mois] + " - ", mois[indice_mois+1] + " - "
+                for employes_dep, employes_arr, cout in zip(depart.tolist(), arrivee.tolist(), couts.tolist()):
+                    yield etiquette_dep + str(employes_dep), etiquette_arr + str(employes_arr), cout
+
+    def exporte_csr(self, elague: bool = False) -> GrapheCSR:
+        """Exporte le graphe pondéré en matrice creuse CSR, sans objet Python par arrête.
+        Les tableaux data, indices et indptr sont assemblés directement à partir des blocs
+        d'arrêtes, déjà triés par sommet de départ."""
+        from scipy.sparse import csr_matrix
+        bas, haut = self._intervalles(elague)
+        tailles = np.maximum(haut - bas + 1, 0)
+        decalages = np.concatenate(([0], np.cumsum(tailles)))
+        nb_sommets = int(decalages[-1])
+        lignes, colonnes, poids = [], [], []
+        for indice_mois, depart, arrivee, couts in self._arretes_couches(elague):
+            lignes.append(decalages[indice_mois] + depart - bas[indice_mois])
+            colonnes.append(decalages[indice_mois+1] + arrivee - bas[indice_mois+1])
+            poids.append(couts)
+        lignes = np.concatenate(lignes) if lignes else np.empty(0, dtype=np.int64)
+        indptr = np.concatenate(([0], np.cumsum(np.bincount(lignes, minlength=nb_sommets))))
+        matrice = csr_matrix(
+            (
+                np.concatenate(poids) if poids else np.empty(0),
+                np.concatenate(colonnes) if colonnes else np.empty(0, dtype=np.int64),
+                indptr
+            ),
+            shape = (nb_sommets, nb_sommets)
+        )
+        return GrapheCSR(
+            matrice = matrice,
+            mois = np.repeat(np.arange(len(tailles)), tailles),
+            employes = np.concatenate([np.arange(b, h+1) for b, h in zip(bas.tolist(), haut.tolist())]),
+            decalages = decalages
+        )
+
     def _sommets_relies(self) -> List[List["Sommet"]]:
         """Renvoie l'ensemble des sommets reliés."""
-        echange = self._inputs_graphe[5]
-        sommets = self._genere_sommets()
-        sommets_relies = []
-        for indice_mois, _ in enumerate(sommets):
-            if indice_mois < len(sommets)-1:
-                for sommet_1 in sommets[indice_mois]:
-                    for sommet_2 in sommets[indice_mois+1] :
-                        indice_mois_1 = self._recupere_indice_mois(
-                            Sommet.par_str(sommet_1).mois
-                        )
-                        indice_mois_2 = self._recupere_indice_mois(
-                            Sommet.par_str(sommet_2).mois
-                        )
-                        employes_mois_1 = Sommet.par_str(sommet_1).nb_employes
-                        employes_mois_2 = Sommet.par_str(sommet_2).nb_employes
-                        if indice_mois_2 - indice_mois_1 == 1:
-                            if employes_mois_2 >= employes_mois_1*(1 - echange.suppression_max) and employes_mois_2 <= employes_mois_1 + echange.ajout_max:
-                                sommets_relies.append(
-                                    (sommet_1, sommet_2, 1)
-                                )
-        return sommets_relies
+        mois = self._compile.mois
+        return [
+            (mois[indice_mois] + " - " + str(employes_dep), mois[indice_mois+1] + " - " + str(employes_arr), 1)
+            for indice_mois, depart, arrivee, _ in self._arretes_couches()
+            for employes_dep, employes_arr in zip(depart.tolist(), arrivee.tolist())
+        ]
 
     def _calcule_couts(self, arrete: Arrete) -> "Arrete":
         """Applique les contraintes de coûts aux sommets reliés."""
-        _, _, _, min_pers, max_pers, _, couts, h_supp = self._inputs_graphe
-        depart, arrivee, cout = arrete
-        employes_dep = Sommet.par_str(depart).nb_employes
-        employes_arr = Sommet.par_str(arrivee).nb_employes
-        indice_mois_arr = self._recupere_indice_mois(
-            Sommet.par_str(arrivee).mois
+        depart, arrivee, _ = arrete
+        sommet_dep = Sommet.par_str(depart)
+        sommet_arr = Sommet.par_str(arrivee)
+        cout = self._cout_arrete(
+            self._recupere_indice_mois(sommet_arr.mois),
+            np.array(sommet_dep.nb_employes),
+            np.array(sommet_arr.nb_employes)
         )
-        cout = abs(employes_arr - employes_dep) * couts.changement  
-        if employes_arr < min_pers[indice_mois_arr]:
-            if min_pers[indice_mois_arr] - (1 + h_supp) * employes_arr > 0:
-                cout += couts.sous_effectif * (min_pers[indice_mois_arr] - (1 + h_supp) * employes_arr)
-        else:
-            if employes_arr > max_pers[indice_mois_arr]:
-                cout += couts.sur_effectif
-        return depart, arrivee, cout
+        return depart, arrivee, cout.item()
 
-    def construit_graphe(self) -> List["Arrete"]:
+    def construit_graphe(self, elague: bool = False) -> List["Arrete"]:
         """Renvoie le graphe pondéré avec pour chaque arrête :
             - le mois de départ et le nombre d'employés,
             - le mois d'arrivée et le nombre d'employés,
             - le coût pour passer de l'état de départ à l'état d'arrivée.
+        Avec elague, les sommets ne menant pas à l'arrivée sont retirés.
+        Enveloppe de genere_arretes conservée pour la compatibilité.
         """
-        return [
-            self._calcule_couts(arrete)
-            for arrete in self._sommets_relies()
-        ]
+        return list(self.genere_arretes(elague))
     
     def contient_arrivee(self) -> bool:
         """Vérifie si le graphe contient le mois de départ et le mois d'arrivée sont reliés."""
-        objectif = self._inputs_graphe[1]
-        for depart, arrivee, cout in self.construit_graphe():
-            if arrivee == objectif:
-                return True
-        return False
-        
-    
\ No newline at end of file
+        return self.faisabilite().resolvable
@@ -3,9 +3,11 @@
 Classes Mois et Probleme permettant de décrire le problème initial de minimisation des coûts de déploiement de personnel.
 """
 
-from typing import List, Generator, Any, Union
-from dataclasses import dataclass
-from rich.table import Table
+from typing import List, Dict, Tuple, Generator, Any, Union
+from dataclasses import dataclass, asdict
+from hashlib import sha256
+import json
+import numpy as np
 
 Mois = str
 Employes = Union[int, float]
@@ -40,8 +42,9 @@ class Couts:
         if self.changement < 0 or self.sur_effectif < 0 or self.sous_effectif < 0:
             raise ValueError("Un coût doit être positif.")
             
-    def genere_table_couts(self) -> Table:
+    def genere_table_couts(self) -> "Table":
         """Renvoie une table rich."""
+        from rich.table import Table
         resultat = Table()
         resultat.add_column("Coûts")
         resultat.add_row(
@@ -93,6 +96,71 @@ class Echange:
             raise ValueError("On ne peut pas enlever tout le personnel présent.")
     
 
+@dataclass(frozen=True, eq=False)
+class ProblemeCompile:
+    """Représentation compilée d'un problème sous forme de tableaux, consommée par GrapheD et Resolution.
+    
+    Les données dérivées (indices des mois, plafond d'employés, bornes de suppression)
+    sont calculées une seule fois. L'empreinte identifie le problème complet
+    et sert de clé de hachage et d'égalité.
+    
+    Exemple :
+    
+    >>> compile = probleme.compile()
+    >>> compile.min_pers, compile.plafond
+    (array([3, 4, 7, 7, 5]), 7)
+    >>> compile.indices["Avril"]
+    2
+    >>> compile.bas_suppression
+    array([0, 1, 2, 2, 3, 4, 4, 5])
+    """
+    
+    mois: Tuple[Mois, ...]
+    indices: Dict[Mois, int]
+    min_pers: np.ndarray
+    max_pers: np.ndarray
+    plafond: int
+    ajout_max: Employes
+    suppression_max: float
+    changement: float
+    sur_effectif: float
+    sous_effectif: float
+    h_supp: float
+    bas_suppression: np.ndarray
+    empreinte: str
+    
+    def __post_init__(self):
+        """Les tableaux sont rendus non modifiables."""
+        for tableau in (self.min_pers, self.max_pers, self.bas_suppression):
+            tableau.setflags(write=False)
+    
+    def __hash__(self) -> int:
+        """Hachage par l'empreinte."""
+        return hash(self.empreinte)
+    
+    def __eq__(self, autre: Any) -> bool:
+        """Egalité des empreintes."""
+        if type(autre) != type(self):
+            return False
+        return self.empreinte == autre.empreinte
+    
+    @property
+    def depart(self) -> int:
+        """Nombre d'employés au premier mois."""
+        return int(self.min_pers[0])
+    
+    @property
+    def arrivee(self) -> int:
+        """Nombre d'employés imposé au dernier mois."""
+        return int(self.min_pers[-1])
+    
+    def bas(self, employes: np.ndarray) -> np.ndarray:
+        """Plus petit nombre d'employés atteignable le mois suivant depuis chaque effectif."""
+        if employes.size and employes.max() < len(self.bas_suppression):
+            return self.bas_suppression[employes]
+        return employes - np.floor(employes * self.suppression_max).astype(employes.dtype)
+
+
 class Probleme:
     """Représente un problème initial de déploiement de personnel.
     
@@ -220,6 +288,7 @@ class Probleme:
         mois = [key for key in self._personnel.keys()]
         if self._personnel[mois[-1]].nb_employes_min != self._personnel[mois[-1]].nb_employes_max:
             raise ValueError(f"Il faut indiquer 2 fois le nombre d'employés présents au mois de {mois[-1]}.")
+        self._compile = None
                
     @staticmethod
     def _encode_prerequis(ligne) -> Prerequis:
@@ -267,6 +336,45 @@ class Probleme:
         couts_valide = cls._encode_couts(couts_str)
         h_supp_valide = float(h_supp_str.strip())
         return cls(personnel_valide, echange_valide, couts_valide, h_supp_valide)
+
+    @staticmethod
+    def _encode_entier(valeur: Any) -> int:
+        """Encode un nombre d'employés lu en JSON, où 3.0 est accepté mais pas 3.5."""
+        if float(valeur) != int(valeur):
+            raise ValueError(f"Un nombre d'employés doit être entier : {valeur}.")
+        return int(valeur)
+
+    @classmethod
+    def par_dict(cls, donnees: Dict[str, Any]) -> "Probleme":
+        """Constructeur alternatif depuis un dictionnaire, par exemple lu en JSON.
+        Un nombre d'employés maximal absent ou nul vaut Inf. Les champs sont convertis comme dans par_str."""
+        personnel = [
+            Prerequis(
+                mois = prerequis["mois"],
+                nb_employes_min = cls._encode_entier(prerequis["nb_employes_min"]),
+                nb_employes_max = Inf if prerequis.get("nb_employes_max") is None else cls._encode_entier(prerequis["nb_employes_max"])
+            )
+            for prerequis in donnees["personnel"]
+        ]
+        echange, couts = donnees["echange"], donnees["couts"]
+        return cls(
+            personnel,
+            Echange(cls._encode_entier(echange["ajout_max"]), float(echange["suppression_max"])),
+            Couts(float(couts["changement"]), float(couts["sur_effectif"]), float(couts["sous_effectif"])),
+            float(donnees["h_supp"])
+        )
+
+    def vers_dict(self) -> Dict[str, Any]:
+        """Dictionnaire sérialisable en JSON, relu par par_dict. Inf est codé par None."""
+        return {
+            "personnel": [
+                {**asdict(prerequis), "nb_employes_max": None if prerequis.nb_employes_max == Inf else prerequis.nb_employes_max}
+                for prerequis in self.personnel
+            ],
+            "echange": asdict(self._echange),
+            "couts": asdict(self._couts),
+            "h_supp": self._h_supp
+        }
         
     @property
     def personnel(self) -> Generator[Prerequis, None, None]:
@@ -280,6 +388,44 @@ class Probleme:
             key for key in self._personnel.keys()
         ]        
     
+    def compile(self) -> ProblemeCompile:
+        """Compile le problème en tableaux une seule fois."""
+        if self._compile is None:
+            mois = tuple(self._personnel)
+            min_pers = np.array([prerequis.nb_employes_min for prerequis in self.personnel], dtype=np.int64)
+            max_pers = np.array([prerequis.nb_employes_max for prerequis in self.personnel], dtype=float)
+            plafond = int(min_pers.max())
+            employes = np.arange(plafond + 1)
+            cle = [
+                mois,
+                min_pers.tolist(),
+                [None if maximum == Inf else maximum for maximum in max_pers.tolist()],
+                [float(self._echange.ajout_max), float(self._echange.suppression_max)],
+                [float(self._couts.changement), float(self._couts.sur_effectif), float(self._couts.sous_effectif)],
+                float(self._h_supp)
+            ]
+            self._compile = ProblemeCompile(
+                mois = mois,
+                indices = {nom: indice for indice, nom in enumerate(mois)},
+                min_pers = min_pers,
+                max_pers = max_pers,
+                plafond = plafond,
+                ajout_max = self._echange.ajout_max,
+                suppression_max = float(self._echange.suppression_max),
+                changement = float(self._couts.changement),
+                sur_effectif = float(self._couts.sur_effectif),
+                sous_effectif = float(self._couts.sous_effectif),
+                h_supp = float(self._h_supp),
+                bas_suppression = employes - np.floor(employes * self._echange.suppression_max).astype(np.int64),
+                empreinte = sha256(json.dumps(cle).encode()).hexdigest()
+            )
+        return self._compile
+    
+    @property
+    def empreinte(self) -> str:
+        """Empreinte stable du problème complet (personnel, échanges, coûts, heures supplémentaires)."""
+        return self.compile().empreinte
+    
     def __eq__(self, autre: Any) -> bool:
         """Egalite."""
         if type(autre) != type(self):
@@ -298,8 +444,9 @@ class Probleme:
         """Accès aux prérequis par le mois correspondant."""
         return self._personnel[mois]
     
-    def genere_table_personnel(self) -> Table:
+    def genere_table_personnel(self) -> "Table":
         """Renvoie une table rich des prérequis."""
+        from rich.table import Table
         resultat = Table()
         resultat.add_column("Mois")
         resultat.add_column("Nombre d'employés minimal")
@@ -309,8 +456,9 @@ class Probleme:
             )
         return resultat
                
-    def genere_table_contraintes(self) -> Table:
+    def genere_table_contraintes(self) -> "Table":
         """Renvoie une table rich."""
+        from rich.table import Table
         resultat = Table()
         resultat.add_column("Contraintes")
         resultat.add_row(
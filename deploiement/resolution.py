@@ -18,10 +18,183 @@ from .modelisation import (
     Sommet,
     Arrete
 )
-from typing import List
-import networkx as nx
-from rich.table import Table
-import matplotlib.pyplot as plt
+from .moteurs import (
+    MOTEURS,
+    Tables,
+    passe_avant,
+    passe_arriere,
+    met_a_jour_avant,
+    met_a_jour_arriere,
+    passe_toutes_arrivees,
+    passe_departs,
+    affine_treillis,
+    k_meilleurs_chemins,
+    front_pareto,
+    _remonte_chemin,
+    _descend_chemin,
+    _chemin_optimal,
+    TOLERANCE
+)
+from .memoire import CacheMemoire
+from typing import List, Tuple, Optional
+from dataclasses import dataclass
+from time import perf_counter
+import numpy as np
+
+
+@dataclass(frozen=True)
+class Solution:
+    """Résultat immuable d'une résolution, partagé par les tables, graphiques et accesseurs.
+    
+    Exemple :
+    
+    >>> solution = Resolution(GrapheD(probleme)).solution
+    >>> solution.employes
+    array([3, 3, 2])
+    >>> solution.couts, solution.couts_cumules
+    (array([ 0., 75., 90.]), array([  0.,  75., 165.]))
+    >>> solution.cout_total
+    165.0
+    """
+    
+    mois: Tuple[Mois, ...]
+    employes: np.ndarray
+    couts: np.ndarray
+    couts_cumules: np.ndarray
+    sommets_par_mois: np.ndarray
+    duree: float
+    
+    def __post_init__(self):
+        """Les tableaux sont rendus non modifiables."""
+        for tableau in (self.employes, self.couts, self.couts_cumules, self.sommets_par_mois):
+            tableau.setflags(write=False)
+    
+    @property
+    def cout_total(self) -> float:
+        """Coût total du déploiement optimal."""
+        return self.couts_cumules[-1].item()
+    
+    @property
+    def changements(self) -> int:
+        """Nombre total d'embauches et de départs."""
+        return int(np.abs(np.diff(self.employes)).sum())
+    
+    @property
+    def pic(self) -> int:
+        """Plus grand nombre d'employés sur la période."""
+        return int(self.employes.max())
+
+
+@dataclass(frozen=True)
+class Arrivees:
+    """Coût optimal de chaque nombre d'employés atteignable le dernier mois, pris comme arrivée.
+    
+    Exemple :
+    
+    >>> arrivees = Resolution(GrapheD(probleme)).toutes_arrivees()
+    >>> arrivees.employes, arrivees.couts
+    (array([1, 2, 3, 4, 5]), array([630., 165.,  75.,  90., 180.]))
+    >>> arrivees.plan(4)
+    array([3, 4, 4])
+    """
+    
+    mois: Tuple[Mois, ...]
+    employes: np.ndarray
+    couts: np.ndarray
+    tables: Tables
+    
+    def __post_init__(self):
+        """Les tableaux sont rendus non modifiables."""
+        for tableau in (self.employes, self.couts):
+            tableau.setflags(write=False)
+    
+    def _indice(self, nb_employes: Employes) -> Optional[int]:
+        """Indice de l'arrivée donnée dans employes, None si elle n'y figure pas (employes peut être vide)."""
+        if len(self.employes) and 0 <= nb_employes - self.employes[0] < len(self.employes):
+            return int(nb_employes - self.employes[0])
+
+    def cout(self, nb_employes: Employes) -> float:
+        """Coût optimal pour l'arrivée donnée, inf si elle n'est pas atteignable."""
+        indice = self._indice(nb_employes)
+        return np.inf if indice is None else self.couts[indice].item()
+    
+    def plan(self, nb_employes: Employes) -> Optional[np.ndarray]:
+        """Nombre d'employés de chaque mois du plan optimal vers l'arrivée donnée."""
+        indice = self._indice(nb_employes)
+        if indice is not None and np.isfinite(self.couts[indice]):
+            return _remonte_chemin(self.tables, indice)
+
+
+@dataclass(frozen=True)
+class Departs:
+    """Coût optimal depuis chaque nombre d'employés d'un intervalle de départs possibles.
+    
+    Exemple :
+    
+    >>> departs = Resolution(GrapheD(probleme)).departs(2, 5)
+    >>> departs.employes, departs.couts
+    (array([2, 3, 4, 5]), array([255., 165., 180., 270.]))
+    >>> departs.plan(4)
+    array([4, 4, 2])
+    """
+    
+    mois: Tuple[Mois, ...]
+    employes: np.ndarray
+    couts: np.ndarray
+    tables: Tables
+    
+    def __post_init__(self):
+        """Les tableaux sont rendus non modifiables."""
+        for tableau in (self.employes, self.couts):
+            tableau.setflags(write=False)
+    
+    def cout(self, nb_employes: Employes) -> float:
+        """Coût optimal depuis le départ donné, inf si l'arrivée n'est pas atteignable."""
+        indice = nb_employes - self.employes[0]
+        if 0 <= indice < len(self.employes):
+            return self.couts[indice].item()
+        return np.inf
+    
+    def plan(self, nb_employes: Employes) -> Optional[np.ndarray]:
+        """Nombre d'employés de chaque mois du plan optimal depuis le départ donné."""
+        indice = nb_employes - self.employes[0]
+        if 0 <= indice < len(self.employes) and np.isfinite(self.couts[indice]):
+            return _descend_chemin(self.tables, indice)
+
+
+@dataclass(frozen=True)
+class Encadrement:
+    """Plan obtenu par affinage du treillis des effectifs, avec un minorant du coût optimal.
+    
+    Exemple :
+    
+    >>> probleme.compile().plafond  # 36 mois autour de 100 000 employés
+    124275
+    >>> encadrement = Resolution(GrapheD(probleme)).encadre(pas_final = 64)
+    >>> encadrement.solution.cout_total, encadrement.borne_inferieure, encadrement.pas
+    (3068800.0, 2857300.0, 64)
+    >>> encadrement.ecart, encadrement.optimal
+    (211500.0, False)
+    >>> Resolution(GrapheD(probleme)).encadre().optimal
+    True
+    """
+    
+    solution: Optional[Solution]
+    borne_inferieure: float
+    pas: int
+    cellules: int
+    
+    @property
+    def ecart(self) -> float:
+        """Ecart entre le coût du plan et le minorant, inf sans plan."""
+        if self.solution is None:
+            return np.inf
+        return self.solution.cout_total - self.borne_inferieure
+    
+    @property
+    def optimal(self) -> bool:
+        """Vrai si le minorant prouve que le plan est optimal."""
+        return self.solution is not None and self.ecart <= TOLERANCE * max(1., abs(self.borne_inferieure))
 
 
 class Resolution:
@@ -120,22 +293,245 @@ mbre - 3', 160, 790.0)]
     None
     """
     
-    def __init__(self, grapheD: GrapheD):
-        """Initialisation à partir d'un objet de classe GrapheD."""
+    def __init__(self, grapheD: GrapheD, moteur: str = "dp", cache: Optional[CacheMemoire] = None):
+        """Initialisation à partir d'un objet de classe GrapheD.
+        Le moteur de résolution est choisi parmi les clés de MOTEURS.
+        La résolution n'a lieu qu'une fois, au premier accès à la solution ;
+        avec un cache, par exemple memoire.CACHE_PARTAGE, elle est partagée par toutes les résolutions
+        du même problème avec le même moteur."""
+        if moteur not in MOTEURS:
+            raise ValueError(f"Moteur inconnu : {moteur}. Moteurs disponibles : {', '.join(MOTEURS)}.")
         self._grapheD = grapheD
+        self._moteur = moteur
+        self._cache = cache
+        self._solution: Optional[Solution] = None
+        self._est_resolu = False
+        self._tables: Optional[Tuple[Tables, Tables]] = None
         
     def _est_resolvable(self) -> bool:
-        """Teste si le probleme est résolvable."""
-        if self._grapheD.contient_arrivee() == True:
-            return True
-        return False
+        """Teste si le probleme est résolvable, sans le résoudre s'il ne l'est pas encore."""
+        if self._est_resolu:
+            return self._solution is not None
+        return self._grapheD.faisabilite().resolvable
         
     def __repr__(self):
         """Affichage."""  
         return f"Resolution(grapheD = {self._grapheD})"
 
-    def _genere_nx_graphe(self) -> nx.DiGraph:
-        """Crée le graphe networkx associé au problème."""
+    def _resout(self) -> Optional[Solution]:
+        """Résout le problème avec le moteur choisi."""
+        debut = perf_counter()
+        if not self._grapheD.faisabilite().resolvable:
+            return None
+        employes = MOTEURS[self._moteur](self._grapheD)
+        if employes is None:
+            return None
+        return self._construit_solution(employes, debut)
+
+    def _construit_solution(self, employes: np.ndarray, debut: float, couches: Optional[List[np.ndarray]] = None) -> Solution:
+        """Construit la solution associée au nombre d'employés de chaque mois d'un chemin.
+        couches remplace, si elles sont renseignées, les couches élaguées dans le décompte des sommets."""
+        couts = np.zeros(len(employes))
+        for indice_mois in range(1, len(employes)):
+            couts[indice_mois] = self._grapheD._cout_arrete(
+                indice_mois, employes[indice_mois-1], employes[indice_mois]
+            )
+        return Solution(
+            mois = self._grapheD._compile.mois,
+            employes = employes,
+            couts = couts,
+            couts_cumules = np.cumsum(couts),
+            sommets_par_mois = self._sommets_par_mois() if couches is None else np.array([len(couche) for couche in couches]),
+            duree = perf_counter() - debut
+        )
+
+    def _sommets_par_mois(self) -> np.ndarray:
+        """Nombre de sommets de chaque couche élaguée, sans construire les couches."""
+        bas, haut = self._grapheD._intervalles(elague=True)
+        return np.maximum(haut - bas + 1, 0)
+
+    @property
+    def solution(self) -> Optional[Solution]:
+        """Solution du problème, calculée une seule fois puis réutilisée."""
+        if not self._est_resolu:
+            if self._cache is None:
+                self._solution = self._resout()
+            else:
+                self._solution = self._cache.resout((self._grapheD._compile.empreinte, self._moteur), self._resout)
+            self._est_resolu = True
+        return self._solution
+
+    def _indice_mois(self, mois: Mois) -> int:
+        """Indice d'un mois du problème."""
+        indice_mois = self._grapheD._recupere_indice_mois(mois)
+        if indice_mois is None:
+            raise ValueError(f"Mois inconnu : {mois}.")
+        return indice_mois
+
+    def _tables_sensibilite(self) -> Optional[Tuple[Tables, Tables]]:
+        """Tables des coûts optimaux depuis le départ et jusqu'à l'arrivée de chaque sommet,
+        calculées une seule fois par deux passes linéaires."""
+        if self._tables is None and self._est_resolvable():
+            self._tables = passe_avant(self._grapheD), passe_arriere(self._grapheD)
+        return self._tables
+
+    def couts_passage(self, mois: Mois) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Renvoie les nombres d'employés possibles au mois donné
+        et le coût optimal d'un plan contraint à passer par chacun d'eux."""
+        indice_mois = self._indice_mois(mois)
+        tables = self._tables_sensibilite()
+        if tables is not None:
+            avant, arriere = tables
+            return avant.couches[indice_mois], avant.valeurs[indice_mois] + arriere.valeurs[indice_mois]
+
+    def cout_passage(self, mois: Mois, nb_employes: Employes) -> float:
+        """Coût optimal d'un plan comptant nb_employes au mois donné, inf si aucun plan ne le permet."""
+        passage = self.couts_passage(mois)
+        if passage is None:
+            return np.inf
+        employes, couts = passage
+        indice = nb_employes - employes[0] if len(employes) else -1
+        if 0 <= indice < len(employes):
+            return couts[indice].item()
+        return np.inf
+
+    def cout_marginal_min(self, mois: Mois) -> Optional[float]:
+        """Variation du coût optimal si le nombre d'employés minimum du mois donné augmente de un
+        (le maximum suit s'il devient inférieur au minimum). inf si le problème n'a alors plus de solution.
+        Pour un mois intermédiaire qui ne porte pas le plus grand minimum, les couches sont inchangées :
+        seul le coût des sommets de ce mois change et les tables suffisent. Sinon le problème est résolu à nouveau."""
+        indice_mois = self._indice_mois(mois)
+        if not self._est_resolvable():
+            return None
+        compile = self._grapheD._compile
+        minimum = int(compile.min_pers[indice_mois]) + 1
+        maximum = max(compile.max_pers[indice_mois].item(), minimum)
+        cout = self.solution.cout_total
+        if 0 < indice_mois < len(compile.mois)-1 and minimum <= compile.plafond:
+            avant, arriere = self._tables_sensibilite()
+            couche = avant.couches[indice_mois]
+            nouveau = (
+                avant.valeurs[indice_mois]
+                - self._grapheD._cout_couche(indice_mois, couche)
+                + self._grapheD._cout_couche(indice_mois, couche, minimum, maximum)
+                + arriere.valeurs[indice_mois]
+            )
+            return nouveau.min().item() - cout
+        probleme = self._grapheD._probleme
+        personnel = [
+            Prerequis(prerequis.mois, minimum, maximum) if prerequis.mois == mois else prerequis
+            for prerequis in probleme.personnel
+        ]
+        solution = Resolution(
+            GrapheD(Probleme(personnel, probleme._echange, probleme._couts, probleme._h_supp)),
+            moteur = self._moteur
+        ).solution
+        return np.inf if solution is None else solution.cout_total - cout
+
+    def modifie_min(self, mois: Mois, valeur: Employes) -> "Resolution":
+        """Renvoie la résolution du problème dont le nombre d'employés minimum du mois donné vaut valeur
+        (le maximum aussi pour le dernier mois ; pour les autres, le maximum suit s'il devient inférieur au minimum,
+        comme dans cout_marginal_min).
+
+        Si les couches élaguées sont inchangées (mois intermédiaire, plafond inchangé), les tables de la passe
+        avant sont reprises avant ce mois, celles de la passe arrière après, et chacune n'est recalculée
+        qu'à partir du mois modifié jusqu'à retrouver les valeurs précédentes à une constante près : une suite de modifications
+        ne coûte que les mois qu'elles affectent. La solution est alors celle des tables mises à jour.
+        Sinon le nouveau problème est résolu entièrement, au premier accès à sa solution.
+        """
+        indice_mois = self._indice_mois(mois)
+        probleme = self._grapheD._probleme
+        dernier = indice_mois == len(probleme.mois) - 1
+        personnel = [
+            Prerequis(prerequis.mois, valeur, valeur if dernier else max(prerequis.nb_employes_max, valeur))
+            if prerequis.mois == mois else prerequis
+            for prerequis in probleme.personnel
+        ]
+        grapheD = GrapheD(Probleme(personnel, probleme._echange, probleme._couts, probleme._h_supp))
+        resolution = Resolution(grapheD, moteur = self._moteur, cache = self._cache)
+        if indice_mois == 0 or dernier or not grapheD.faisabilite().resolvable:
+            return resolution
+        tables = self._tables_sensibilite()
+        if tables is None:
+            return resolution
+        couches = grapheD._genere_couches(elague=True)
+        if any(
+            len(couche) != len(ancienne) or (len(couche) and couche[0] != ancienne[0])
+            for couche, ancienne in zip(couches, tables[0].couches)
+        ):
+            return resolution
+        debut = perf_counter()
+        avant = met_a_jour_avant(grapheD, tables[0], indice_mois)
+        arriere = met_a_jour_arriere(grapheD, tables[1], indice_mois)
+        resolution._tables = avant, arriere
+        resolution._solution = resolution._construit_solution(_chemin_optimal(grapheD, avant), debut)
+        resolution._est_resolu = True
+        return resolution
+
+    def k_meilleurs(self, k: int) -> List[Solution]:
+        """Renvoie au plus k plans distincts, du moins coûteux au plus coûteux.
+        Le premier est un plan optimal ; la liste est vide si le problème n'a pas de solution."""
+        if k < 1:
+            raise ValueError("k doit être au moins égal à 1.")
+        if not self._est_resolvable():
+            return []
+        debut = perf_counter()
+        tables = self._tables[0] if self._tables is not None else None
+        return [
+            self._construit_solution(employes, debut)
+            for employes in k_meilleurs_chemins(self._grapheD, k, tables)
+        ]
+
+    def front_pareto(self) -> List[Solution]:
+        """Renvoie les plans non dominés pour (coût total, changements, pic), par coût croissant.
+        La liste est vide si le problème n'a pas de solution."""
+        if not self._est_resolvable():
+            return []
+        debut = perf_counter()
+        return [self._construit_solution(employes, debut) for employes in front_pareto(self._grapheD)]
+
+    def toutes_arrivees(self, haut: Optional[Employes] = None) -> Optional[Arrivees]:
+        """Résout en une seule passe avant vers chaque nombre d'employés atteignable le dernier mois jusqu'à haut,
+        sans tenir compte de celui imposé par le problème. Par défaut, haut est le plafond plus un mois d'ajouts,
+        dans la limite du double du plafond. Les arrivées sont vides si haut est sous la plus petite arrivée atteignable.
+        None si le problème n'a qu'un mois."""
+        if len(self._grapheD._compile.mois) < 2:
+            return None
+        tables = passe_toutes_arrivees(self._grapheD, None if haut is None else int(haut))
+        return Arrivees(
+            mois = self._grapheD._compile.mois,
+            employes = tables.couches[-1],
+            couts = tables.valeurs[-1],
+            tables = tables
+        )
+
+    def departs(self, bas: Employes, haut: Employes) -> Optional[Departs]:
+        """Résout en une seule passe arrière depuis chaque nombre d'employés de [bas, haut] au premier mois,
+        à la place du départ imposé par le problème. None si le problème n'a qu'un mois."""
+        if not 0 <= bas <= haut:
+            raise ValueError("L'intervalle de départs doit vérifier 0 <= bas <= haut.")
+        if len(self._grapheD._compile.mois) < 2:
+            return None
+        tables = passe_departs(self._grapheD, bas, haut)
+        return Departs(
+            mois = self._grapheD._compile.mois,
+            employes = tables.couches[0],
+            couts = tables.valeurs[0],
+            tables = tables
+        )
+
+    def encadre(self, pas_final: int = 1, cellules: int = 32) -> Encadrement:
+        """Résout par affinage d'un treillis d'effectifs (moteur treillis), en s'arrêtant au pas pas_final :
+        le plan est prouvé optimal au pas 1, l'écart au minorant est connu sinon."""
+        debut = perf_counter()
+        employes, borne_inferieure, pas, cellules = affine_treillis(self._grapheD, pas_final, cellules)
+        solution = None if employes is None else self._construit_solution(employes, debut)
+        return Encadrement(solution, borne_inferieure, pas, cellules)
+
+    def _genere_nx_graphe(self) -> "nx.DiGraph":
+        """Crée le graphe networkx associé au problème.
+        networkx n'est importé qu'à la demande d'un tel export."""
+        import networkx as nx
         if self._est_resolvable():
             resultat = nx.DiGraph()
             resultat.add_weighted_edges_from(
@@ -145,55 +541,42 @@ mbre - 3', 160, 790.0)]
             return resultat
 
     def _trouve_chemin(self) -> List[str]:
-        """Résolution du problème avec l'algorithme de Dijsktra."""
-        depart, arrivee, _, _, _, _, _, _ = self._grapheD._inputs_graphe
+        """Chemin optimal sous forme de libellés 'Mois - n'."""
         if self._est_resolvable():
-            return nx.shortest_path(
-                G = self._genere_nx_graphe(), 
-                source = depart,
-                target = arrivee,
-                weight = "coût"
-            )  
+            return [
+                mois + " - " + str(nb_employes)
+                for mois, nb_employes in zip(self.solution.mois, self.solution.employes.tolist())
+            ]
 
     def _couts_optimaux(self) -> List[float]:
         """Renvoie les coûts associés au chemin optimal et les coûts cumulés."""
         if self._est_resolvable():
-            graphe_initial = self._genere_nx_graphe()
-            graphe_optimal = nx.path_graph(self._trouve_chemin()) 
-            couts_cumules = [0]
-            couts = [0]
-            for arrete in graphe_optimal.edges():
-                couts_cumules.append(
-                    couts_cumules[-1] + graphe_initial.edges[arrete[0], arrete[1]]["coût"]
-                )
-                couts.append(
-                    graphe_initial.edges[arrete[0], arrete[1]]["coût"]
-                )
-            return couts, couts_cumules
+            return self.solution.couts.tolist(), self.solution.couts_cumules.tolist()
 
     def _bilan(self) -> List[Arrete]:
         """Renvoie un bilan des sommets parcourus avec le coût cumulé associé."""
         if self._est_resolvable():
             sommets = self._trouve_chemin()
             couts, couts_cumules = self._couts_optimaux()
-            assert len(sommets) == len(couts) == len(couts_cumules)
-            return [
-                (sommets[i], couts[i], couts_cumules[i])
-                for i in range(len(sommets))
-            ]
+            return list(zip(sommets, couts, couts_cumules))
 
-    def genere_table(self) -> Table:
-        """Retourn une table rich."""
+    def genere_table(self) -> "Table":
+        """Retourn une table rich.
+        rich n'est importé qu'à l'affichage."""
         if self._est_resolvable():
+            from rich.table import Table
             resultat = Table()
             resultat.add_column("Mois")
             resultat.add_column("Nombre d'employés")
             resultat.add_column("Coût mensuel")
             resultat.add_column("Coûts cumulés")
-            for sommet, cout, couts_cumules in self._bilan():
+            solution = self.solution
+            for mois, nb_employes, cout, couts_cumules in zip(
+                solution.mois, solution.employes.tolist(), solution.couts.tolist(), solution.couts_cumules.tolist()
+            ):
                 resultat.add_row(
-                    Sommet.par_str(sommet).mois,
-                    str(Sommet.par_str(sommet).nb_employes),
+                    mois,
+                    str(nb_employes),
                     str(round(cout, 2)) + "€",
                     str(round(couts_cumules, 2)) + "€"
                 )
@@ -204,45 +587,40 @@ mbre - 3', 160, 790.0)]
         from rich import print
         print(self.genere_table())
         
-    def graphique_personnel(self, ax) -> plt.Figure:
+    def graphique_personnel(self, ax) -> "plt.Figure":
         """Renvoie le graphique du nombre d'employés optimal."""
-        for sommet, cout, couts_cumules in self._bilan():
+        solution = self.solution
+        for mois, nb_employes in zip(solution.mois, solution.employes.tolist()):
             ax.hlines(
-                y=Sommet.par_str(sommet).mois, 
+                y=mois, 
                 xmin=0, 
-                xmax=Sommet.par_str(sommet).nb_employes,
+                xmax=nb_employes,
                 color='gray', 
                 alpha=0.7, 
                 linewidth=1, 
                 linestyles='dashdot'
             )
             ax.scatter(
-                y=Sommet.par_str(sommet).mois,
-                x=Sommet.par_str(sommet).nb_employes,
+                y=mois,
+                x=nb_employes,
                 s=60, 
                 color='cadetblue', 
                 alpha=0.7
             )
-        ax.set_xlim(
-            0, max(
-                [
-                    Sommet.par_str(sommet).nb_employes
-                    for sommet, _, _ in self._bilan() 
-                ]
-            ) + 1
-        )
-        ax.set_yticklabels(
-            [sommet[:3] for sommet, _, _ in self._bilan()]
-        )
+        ax.set_xlim(0, solution.employes.max() + 1)
+        ax.set_yticklabels([mois[:3] for mois in solution.mois])
         ax.set_ylabel(" ")
         ax.set_xlabel(" ")
         ax.set_title("Nombre d'employés optimal")
 
-    def graphique_couts(self, ax) -> plt.Figure:
+    def graphique_couts(self, ax) -> "plt.Figure":
         """Renvoie le graphique des coûts et coûts cumulés."""
-        for sommet, cout, couts_cumules in self._bilan():
+        solution = self.solution
+        for mois, cout, couts_cumules in zip(
+            solution.mois, solution.couts.tolist(), solution.couts_cumules.tolist()
+        ):
             ax.vlines(
-                x=Sommet.par_str(sommet).mois,
+                x=mois,
                 ymin=0, 
                 ymax=couts_cumules, 
                 color='cadetblue',
@@ -250,7 +628,7 @@ mbre - 3', 160, 790.0)]
                 linewidth=20
             )
             ax.vlines(
-                x=Sommet.par_str(sommet).mois,
+                x=mois,
                 ymin=0, 
                 ymax=cout, 
                 color='blue',
@@ -258,7 +636,7 @@ mbre - 3', 160, 790.0)]
                 linewidth=20
             )
             ax.text(
-                x=Sommet.par_str(sommet).mois,
+                x=mois,
                 y=cout+.3,
                 s=str(round(cout, 2))+"€",
                 horizontalalignment='center', 
@@ -267,31 +645,24 @@ mbre - 3', 160, 790.0)]
                 alpha=.7
             )
             ax.text(
-                x=Sommet.par_str(sommet).mois,
+                x=mois,
                 y=couts_cumules+.3,
                 s=str(round(couts_cumules, 2))+"€",
                 horizontalalignment='center', 
                 verticalalignment='bottom',
                 color='cadetblue'
                 )
-        ax.set_ylim(
-            0, max(
-                [
-                    couts_cumules
-                    for sommet, _, _ in self._bilan() 
-                ]
-            ) + 100
-        )
-        ax.set_xticklabels(
-            [sommet[:3] for sommet, _, _ in self._bilan()]
-        )
+        ax.set_ylim(0, solution.couts_cumules.max() + 100)
+        ax.set_xticklabels([mois[:3] for mois in solution.mois])
         ax.set_ylabel("Coûts en €")
         ax.set_title("Coûts minimisés")
         ax.legend(["Coûts cumulés", "Coût mensuel"], loc='upper left')
     
-    def genere_graphique(self) -> plt.Figure:
-        """Renvoie une figure matplotlib pour visualiser la solution."""
+    def genere_graphique(self) -> "plt.Figure":
+        """Renvoie une figure matplotlib pour visualiser la solution.
+        matplotlib n'est importé qu'à la demande d'un graphique."""
         if self._est_resolvable():
+            import matplotlib.pyplot as plt
             figure, (ax1, ax2) = plt.subplots(1, 2, figsize=(13, 5))
             self.graphique_personnel(ax1)
             self.graphique_couts(ax2)
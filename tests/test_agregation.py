@@ -0,0 +1,102 @@
+"""Description.
+
+Tests de la résolution hiérarchique du module agregation.
+"""
+
+import coverage
+import pytest
+import numpy as np
+from deploiement import (
+    Inf,
+    Couts,
+    Prerequis,
+    Echange,
+    Probleme,
+    GrapheD,
+    Resolution
+)
+from deploiement.agregation import agrege, resout_hierarchique
+
+
+@pytest.fixture
+def probleme():
+    """Problème hebdomadaire sur un an, avec un pic saisonnier."""
+    minimums = [int(40 + 25 * np.sin(semaine / 8)) for semaine in range(51)]
+    return Probleme(
+        personnel = [Prerequis(f"S{semaine}", minimum, Inf) for semaine, minimum in enumerate(minimums)]
+            + [Prerequis("S51", 40, 40)],
+        echange = Echange(4, 1/10),
+        couts = Couts(50, 100, 300),
+        h_supp = 1/10
+    )
+
+def test_agrege(probleme):
+    """Le problème agrégé garde le départ et l'arrivée et prend le minimum le plus fort de chaque bloc."""
+    grossier, indices = agrege(probleme, 4)
+    assert indices.tolist() == list(range(0, 52, 4)) + [51]
+    assert grossier.mois == ["S0"] + [f"S{indice}" for indice in indices[1:]]
+    assert grossier["S4"].nb_employes_min == max(probleme[f"S{semaine}"].nb_employes_min for semaine in range(1, 5))
+    assert grossier["S51"] == probleme["S51"]
+    assert grossier._echange.ajout_max == 16
+    assert grossier._couts == Couts(50, 400, 1200)
+    with pytest.raises(ValueError):
+        agrege(probleme, 0)
+
+def test_agrege_suppression_cumulee():
+    """Le taux de suppression cumulé reste inférieur à 1 même s'il s'arrondit à 1 en flottant."""
+    probleme = Probleme(
+        personnel = [Prerequis(f"J{jour}", 10 + jour % 7, Inf) for jour in range(90)] + [Prerequis("J90", 10, 10)],
+        echange = Echange(2, 1/2),
+        couts = Couts(50, 100, 300),
+        h_supp = 0
+    )
+    grossier, _ = agrege(probleme, 60)
+    assert grossier._echange.suppression_max < 1
+    raffinement = resout_hierarchique(probleme, 60)
+    assert raffinement.solution.cout_total >= Resolution(GrapheD(probleme)).solution.cout_total
+
+def test_resout_hierarchique(probleme):
+    """Le plan du couloir a le coût optimal, sur une partie seulement des sommets."""
+    attendu = Resolution(GrapheD(probleme)).solution
+    raffinement = resout_hierarchique(probleme, 4)
+    assert raffinement.solution.cout_total == attendu.cout_total
+    assert len(raffinement.grossiere.employes) == 14
+    assert raffinement.solution.sommets_par_mois.sum() < attendu.sommets_par_mois.sum()
+
+def test_elargissement(probleme):
+    """Un couloir trop étroit est élargi jusqu'à contenir le plan optimal."""
+    raffinement = resout_hierarchique(probleme, 8, largeur = 1)
+    assert raffinement.elargissements > 0
+    assert raffinement.largeur == 2 ** raffinement.elargissements
+    assert raffinement.solution.cout_total == Resolution(GrapheD(probleme)).solution.cout_total
+    with pytest.raises(ValueError):
+        resout_hierarchique(probleme, 8, largeur = 0)
+
+def test_heuristique():
+    """Sans couloir complet, un meilleur plan peut passer hors du couloir : le résultat n'est pas garanti."""
+    minimums = [(19, 19), (15, Inf), (2, Inf), (11, Inf), (4, 7), (18, 18), (20, Inf), (3, Inf), (12, Inf), (7, 7)]
+    probleme = Probleme(
+        personnel = [Prerequis(f"P{indice}", *bornes) for indice, bornes in enumerate(minimums)],
+        echange = Echange(0, 1/4),
+        couts = Couts(119, 260, 8),
+        h_supp = 0
+    )
+    raffinement = resout_hierarchique(probleme, 3)
+    assert not raffinement.complet
+    assert raffinement.solution.cout_total == 1744
+    assert Resolution(GrapheD(probleme)).solution.cout_total == 1676
+
+def test_sans_solution():
+    """Sans solution, le plan fin vaut None."""
+    probleme = Probleme(
+        personnel = [
+            Prerequis(mois = "Février", nb_employes_min = 3, nb_employes_max = Inf),
+            Prerequis(mois = "Mars", nb_employes_min = 7, nb_employes_max = 7)
+        ],
+        echange = Echange(3, 1/3),
+        couts = Couts(160, 200, 200),
+        h_supp = 1/4
+    )
+    raffinement = resout_hierarchique(probleme, 2)
+    assert raffinement.solution is None
+    assert raffinement.complet
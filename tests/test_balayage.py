@@ -0,0 +1,72 @@
+"""Description.
+
+Tests du balayage vectorisé des paramètres du module balayage.
+"""
+
+import coverage
+import pytest
+import numpy as np
+from deploiement import (
+    Inf,
+    Couts,
+    Prerequis,
+    Echange,
+    Probleme,
+    GrapheD,
+    Resolution
+)
+from deploiement.balayage import (
+    _minimums_fenetres,
+    balaye
+)
+
+
+@pytest.fixture
+def personnel():
+    """Besoins en personnel utilisés pour les tests."""
+    return [
+        Prerequis(mois = "Janvier", nb_employes_min = 3, nb_employes_max = Inf),
+        Prerequis(mois = "Février", nb_employes_min = 8, nb_employes_max = Inf),
+        Prerequis(mois = "Mars", nb_employes_min = 4, nb_employes_max = 6),
+        Prerequis(mois = "Avril", nb_employes_min = 7, nb_employes_max = Inf),
+        Prerequis(mois = "Mai", nb_employes_min = 5, nb_employes_max = 5)
+    ]
+
+def test_minimums_fenetres():
+    """Minimum par variante sur des fenêtres quelconques, fenêtre vide comprise."""
+    valeurs = np.array([[4., 2, 5, 1, 3], [0, 9, 9, 9, 1]])
+    minimums, positions = _minimums_fenetres(valeurs, np.array([0, 2, 1, 4]), np.array([4, 2, 3, 3]))
+    assert minimums.tolist() == [[1, 5, 1, np.inf], [0, 9, 9, np.inf]]
+    assert positions.tolist() == [[3, 2, 3, -1], [0, 2, 1, -1]]
+
+def test_balaye(personnel):
+    """Chaque variante du balayage a le coût optimal de la résolution directe."""
+    changements, heures = [50, 160, 400], [0, 1/4]
+    balayage = balaye(
+        Probleme(personnel, Echange(3, 1/3), Couts(160, 200, 200), 1/4),
+        changement = changements,
+        h_supp = heures
+    )
+    assert balayage.couts.shape == (3, 1, 1, 2)
+    for i, changement in enumerate(changements):
+        for j, h_supp in enumerate(heures):
+            probleme = Probleme(personnel, Echange(3, 1/3), Couts(changement, 200, 200), h_supp)
+            solution = Resolution(GrapheD(probleme)).solution
+            assert balayage.couts[i, 0, 0, j] == pytest.approx(solution.cout_total)
+            plan = balayage.plan(i, 0, 0, j)
+            assert plan[0] == 3 and plan[-1] == 5
+
+def test_balaye_sans_solution():
+    """Sans solution, tous les coûts sont infinis et aucun plan n'est disponible."""
+    personnel = [
+        Prerequis(mois = "Février", nb_employes_min = 3, nb_employes_max = Inf),
+        Prerequis(mois = "Mars", nb_employes_min = 7, nb_employes_max = 7)
+    ]
+    balayage = balaye(Probleme(personnel, Echange(3, 1/3), Couts(160, 200, 200), 1/4), sous_effectif = [100, 200])
+    assert np.isinf(balayage.couts).all()
+    assert balayage.plan(0, 0, 0, 0) is None
+
+def test_balaye_parametre_negatif(personnel):
+    """Un paramètre négatif est refusé."""
+    with pytest.raises(ValueError):
+        balaye(Probleme(personnel, Echange(3, 1/3), Couts(160, 200, 200), 1/4), changement = [-1])
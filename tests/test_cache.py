@@ -0,0 +1,96 @@
+"""Description.
+
+Tests du cache SQLite des solutions du module cache.
+"""
+
+import coverage
+import pytest
+from deploiement import (
+    Inf,
+    Couts,
+    Prerequis,
+    Echange,
+    Probleme,
+    GrapheD,
+    Resolution
+)
+from deploiement import cache as module_cache
+from deploiement.cache import CacheSolutions
+from deploiement.lot import resoudre_lot
+
+
+@pytest.fixture
+def probleme():
+    """Problème utilisé pour les tests."""
+    return Probleme(
+        personnel = [
+            Prerequis(mois = "Février", nb_employes_min = 3, nb_employes_max = Inf),
+            Prerequis(mois = "Mars", nb_employes_min = 4, nb_employes_max = Inf),
+            Prerequis(mois = "Avril", nb_employes_min = 2, nb_employes_max = 2)
+        ],
+        echange = Echange(1, 1/2),
+        couts = Couts(90, 100, 300),
+        h_supp = 1/4
+    )
+
+@pytest.fixture
+def probleme_sans_solution():
+    """Problème dont l'arrivée n'est pas atteignable."""
+    return Probleme(
+        personnel = [
+            Prerequis(mois = "Février", nb_employes_min = 3, nb_employes_max = Inf),
+            Prerequis(mois = "Mars", nb_employes_min = 7, nb_employes_max = 7)
+        ],
+        echange = Echange(3, 1/3),
+        couts = Couts(160, 200, 200),
+        h_supp = 1/4
+    )
+
+def test_cache_resout(tmp_path, probleme, monkeypatch):
+    """Une solution retrouvée est identique et ne construit aucun GrapheD."""
+    cache = CacheSolutions(str(tmp_path / "cache.sqlite"))
+    solution = cache.resout(probleme)
+    assert len(cache) == 1
+    monkeypatch.setattr(module_cache, "GrapheD", None)
+    relue = CacheSolutions(cache.chemin).resout(probleme)
+    assert relue.employes.tolist() == solution.employes.tolist()
+    assert relue.couts.tolist() == solution.couts.tolist()
+    assert relue.cout_total == solution.cout_total
+    assert relue.mois == solution.mois
+
+def test_cache_sans_solution(tmp_path, probleme_sans_solution):
+    """Un problème sans solution est conservé comme tel."""
+    cache = CacheSolutions(str(tmp_path / "cache.sqlite"))
+    assert cache.lit(probleme_sans_solution) == (False, None)
+    assert cache.resout(probleme_sans_solution) is None
+    assert cache.lit(probleme_sans_solution) == (True, None)
+
+def test_cache_cle(probleme):
+    """La clé dépend du moteur."""
+    assert CacheSolutions.cle(probleme, "dag") != CacheSolutions.cle(probleme, "dp")
+
+def test_cache_eviction(tmp_path, probleme):
+    """Au-delà de taille_max, les entrées les moins récemment utilisées sont supprimées."""
+    cache = CacheSolutions(str(tmp_path / "cache.sqlite"), taille_max = 2)
+    problemes = [
+        Probleme(list(probleme.personnel), Echange(1, 1/2), Couts(changement, 100, 300), 1/4)
+        for changement in (10, 20, 30)
+    ]
+    cache.resout(problemes[0])
+    cache.resout(problemes[1])
+    cache.lit(problemes[0])
+    cache.resout(problemes[2])
+    assert len(cache) == 2
+    assert cache.lit(problemes[0])[0] and not cache.lit(problemes[1])[0]
+    with pytest.raises(ValueError):
+        CacheSolutions(cache.chemin, taille_max = 0)
+
+def test_cache_lot(tmp_path, probleme, probleme_sans_solution):
+    """Le cache est partagé par les processus d'un lot et réutilisé d'une exécution à l'autre."""
+    chemin = str(tmp_path / "cache.sqlite")
+    problemes = [probleme, probleme_sans_solution] * 4
+    premiers = list(resoudre_lot(problemes, jobs = 2, cache = chemin))
+    seconds = list(resoudre_lot(problemes, jobs = 2, cache = chemin))
+    assert [resultat.statut for resultat in seconds] == [resultat.statut for resultat in premiers]
+    assert seconds[0].solution.cout_total == 165
+    assert len(CacheSolutions(chemin)) == 2
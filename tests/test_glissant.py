@@ -0,0 +1,118 @@
+"""Description.
+
+Tests de la planification glissante du module glissant.
+"""
+
+import coverage
+import pytest
+from deploiement import (
+    Inf,
+    Couts,
+    Prerequis,
+    Echange,
+    Probleme,
+    GrapheD,
+    Resolution
+)
+from deploiement import moteurs
+from deploiement.glissant import PlanGlissant
+
+
+@pytest.fixture
+def probleme():
+    """Problème utilisé pour les tests."""
+    return Probleme(
+        personnel = [
+            Prerequis(mois = "Février", nb_employes_min = 3, nb_employes_max = Inf),
+            Prerequis(mois = "Mars", nb_employes_min = 4, nb_employes_max = Inf),
+            Prerequis(mois = "Avril", nb_employes_min = 6, nb_employes_max = Inf),
+            Prerequis(mois = "Mai", nb_employes_min = 7, nb_employes_max = Inf),
+            Prerequis(mois = "Juin", nb_employes_min = 4, nb_employes_max = Inf),
+            Prerequis(mois = "Juillet", nb_employes_min = 4, nb_employes_max = Inf),
+            Prerequis(mois = "Août", nb_employes_min = 2, nb_employes_max = Inf),
+            Prerequis(mois = "Septembre", nb_employes_min = 3, nb_employes_max = 3)
+        ],
+        echange = Echange(3, 1/3),
+        couts = Couts(160, 200, 200),
+        h_supp = 1/4
+    )
+
+def resout(probleme):
+    """Solution d'une résolution complète."""
+    return Resolution(GrapheD(probleme)).solution
+
+def test_solution(probleme):
+    """Le plan initial est celui d'une résolution complète."""
+    plan = PlanGlissant(probleme)
+    assert plan.solution.employes.tolist() == [3, 4, 5, 5, 5, 5, 4, 3]
+    assert plan.solution.cout_total == 790
+    assert plan.probleme is probleme
+
+def test_avance(probleme, monkeypatch):
+    """Avancer d'un mois ne recalcule aucune couche tant que l'effectif réalisé est couvert par les tables."""
+    plan = PlanGlissant(probleme)
+    appels = []
+    relaxe_couche_arriere = moteurs._relaxe_couche_arriere
+    monkeypatch.setattr(moteurs, "_relaxe_couche_arriere", lambda *args: appels.append(args[1]) or relaxe_couche_arriere(*args))
+    assert plan.avance().employes.tolist() == [4, 5, 5, 5, 5, 4, 3]
+    solution = plan.avance(effectif = 7)
+    assert appels == []
+    assert solution.employes.tolist() == [7, 7, 7, 5, 4, 3]
+    assert solution.cout_total == resout(plan.probleme).cout_total
+    assert plan.probleme.mois[0] == "Avril"
+    solution = plan.avance(effectif = 12)
+    assert appels != []
+    assert solution.cout_total == resout(plan.probleme).cout_total
+
+def test_avance_sur_effectif():
+    """Un plan au-dessus du maximum du mois suivant peut avancer : le maximum suit l'effectif réalisé."""
+    plan = PlanGlissant(Probleme(
+        personnel = [
+            Prerequis(mois = "Janvier", nb_employes_min = 3, nb_employes_max = Inf),
+            Prerequis(mois = "Février", nb_employes_min = 2, nb_employes_max = 3),
+            Prerequis(mois = "Mars", nb_employes_min = 9, nb_employes_max = Inf),
+            Prerequis(mois = "Avril", nb_employes_min = 9, nb_employes_max = Inf),
+            Prerequis(mois = "Mai", nb_employes_min = 9, nb_employes_max = 9)
+        ],
+        echange = Echange(3, 1/3),
+        couts = Couts(10, 50, 300),
+        h_supp = 0
+    ))
+    assert plan.solution.employes.tolist() == [3, 6, 9, 9, 9]
+    solution = plan.avance()
+    assert solution.employes.tolist() == [6, 9, 9, 9]
+    assert solution.cout_total == resout(plan.probleme).cout_total
+    solution = plan.avance(effectif = 12)
+    assert solution.cout_total == resout(plan.probleme).cout_total
+
+def test_avance_fin(probleme):
+    """Il faut au moins trois mois pour avancer."""
+    plan = PlanGlissant(probleme)
+    for _ in range(6):
+        plan.avance()
+    assert plan.solution.employes.tolist() == [4, 3]
+    with pytest.raises(ValueError):
+        plan.avance()
+
+def test_prevoit(probleme, monkeypatch):
+    """Une révision ne recalcule que les mois qui la précèdent ; un ajout change l'arrivée."""
+    plan = PlanGlissant(probleme)
+    plan.avance()
+    appels = []
+    relaxe_couche_arriere = moteurs._relaxe_couche_arriere
+    monkeypatch.setattr(moteurs, "_relaxe_couche_arriere", lambda *args: appels.append(args[1]) or relaxe_couche_arriere(*args))
+    solution = plan.prevoit(Prerequis("Juin", 6, Inf))
+    assert solution.cout_total == resout(plan.probleme).cout_total
+    assert max(appels) == 2
+    solution = plan.prevoit(Prerequis("Septembre", 3, Inf), Prerequis("Octobre", 5, 5))
+    assert plan.probleme.mois[-1] == "Octobre"
+    assert solution.cout_total == resout(plan.probleme).cout_total
+    with pytest.raises(ValueError):
+        plan.prevoit(Prerequis("Mars", 2, Inf))
+
+def test_sans_solution(probleme):
+    """Sans solution, le plan vaut None et l'effectif réalisé doit être indiqué."""
+    plan = PlanGlissant(probleme)
+    assert plan.prevoit(Prerequis("Octobre", 30, 30)) is None
+    with pytest.raises(ValueError):
+        plan.avance()
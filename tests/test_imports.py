@@ -0,0 +1,50 @@
+"""Description.
+
+Tests du chargement paresseux du module deploiement.
+"""
+
+import coverage
+import subprocess
+import sys
+import pytest
+
+BUDGET_IMPORT = 0.1
+MODULES_LOURDS = ("numpy", "rich", "matplotlib", "networkx", "scipy")
+
+
+def execute(code: str) -> subprocess.CompletedProcess:
+    """Exécute du code dans un nouvel interpréteur."""
+    return subprocess.run([sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True)
+
+def test_budget_import():
+    """import deploiement reste sous le budget, mesuré par -X importtime."""
+    sortie = execute("import deploiement")
+    cumul = [
+        int(ligne.split("|")[1])
+        for ligne in sortie.stderr.splitlines()
+        if ligne.split("|")[-1].strip() == "deploiement"
+    ]
+    assert cumul and cumul[0] / 1e6 < BUDGET_IMPORT
+
+def test_import_sans_modules_lourds():
+    """import deploiement ne charge aucune dépendance lourde."""
+    sortie = execute(f"import sys, deploiement; print([m for m in {MODULES_LOURDS!r} if m in sys.modules])")
+    assert sortie.stdout.strip() == "[]"
+
+def test_faisabilite_sans_affichage():
+    """Construire un problème et tester sa faisabilité ne charge ni rich, ni matplotlib, ni networkx."""
+    code = (
+        "import sys\n"
+        "from deploiement import Probleme, GrapheD\n"
+        "probleme = Probleme.par_str('Février / 3 / Inf\\nMars / 4 / 4', '3 / .33', '160 / 200 / 200', '.25')\n"
+        "assert GrapheD(probleme).faisabilite().resolvable\n"
+        "print([m for m in ('rich', 'matplotlib', 'networkx') if m in sys.modules])"
+    )
+    assert execute(code).stdout.strip() == "[]"
+
+def test_attribut_inconnu():
+    """Un nom non exporté lève AttributeError."""
+    import deploiement
+    with pytest.raises(AttributeError):
+        deploiement.Inconnu
+    assert "Resolution" in dir(deploiement)
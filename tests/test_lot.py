@@ -0,0 +1,83 @@
+"""Description.
+
+Tests de la résolution par lots du module lot.
+"""
+
+import coverage
+import pytest
+from deploiement import (
+    Inf,
+    Couts,
+    Prerequis,
+    Echange,
+    Probleme,
+    GrapheD,
+    Resolution
+)
+from deploiement.lot import (
+    ResultatLot,
+    resoudre_lot
+)
+
+
+@pytest.fixture
+def problemes():
+    """Lot mêlant problèmes résolvables, sans solution et données invalides."""
+    resolvable = Probleme(
+        personnel = [
+            Prerequis(mois = "Février", nb_employes_min = 3, nb_employes_max = Inf),
+            Prerequis(mois = "Mars", nb_employes_min = 4, nb_employes_max = Inf),
+            Prerequis(mois = "Avril", nb_employes_min = 2, nb_employes_max = 2)
+        ],
+        echange = Echange(1, 1/2),
+        couts = Couts(90, 100, 300),
+        h_supp = 1/4
+    )
+    sans_solution = Probleme(
+        personnel = [
+            Prerequis(mois = "Février", nb_employes_min = 3, nb_employes_max = Inf),
+            Prerequis(mois = "Mars", nb_employes_min = 7, nb_employes_max = 7)
+        ],
+        echange = Echange(3, 1/3),
+        couts = Couts(160, 200, 200),
+        h_supp = 1/4
+    )
+    en_texte = ("Février / 3 /\nMars / 4 /\nAvril / 7 /\nMai / 7 /\nJuin / 5 / 5", "3 / .33", "160 / 200 / 200", ".25")
+    invalide = ("Février / 3 /\nMars / 4 / 8", "3 / .33", "160 / 200 / 200", ".25")
+    return [resolvable, sans_solution, en_texte, invalide] * 5
+
+def test_resoudre_lot_sequentiel(problemes):
+    """Les erreurs sont conservées par problème sans interrompre le lot."""
+    resultats = list(resoudre_lot(problemes, jobs=1))
+    assert [resultat.indice for resultat in resultats] == list(range(20))
+    assert [resultat.statut for resultat in resultats[:4]] == ["resolu", "sans_solution", "resolu", "invalide"]
+    assert resultats[0].solution.cout_total == 165
+    assert resultats[2].solution.cout_total == 620
+    assert "ValueError" in resultats[3].erreur
+
+def test_resoudre_lot_parallele(problemes):
+    """Le pool de processus donne les mêmes résultats, dans l'ordre du lot."""
+    sequentiel = list(resoudre_lot(problemes, jobs=1))
+    parallele = list(resoudre_lot(iter(problemes), jobs=2))
+    assert [resultat.indice for resultat in parallele] == list(range(20))
+    assert [resultat.statut for resultat in parallele] == [resultat.statut for resultat in sequentiel]
+    assert [
+        resultat.solution.cout_total for resultat in parallele if resultat.solution is not None
+    ] == [
+        resultat.solution.cout_total for resultat in sequentiel if resultat.solution is not None
+    ]
+
+def test_resoudre_lot_non_ordonne(problemes):
+    """Sans ordre imposé, chaque problème est rendu exactement une fois."""
+    resultats = list(resoudre_lot(problemes, jobs=2, ordonne=False))
+    assert sorted(resultat.indice for resultat in resultats) == list(range(20))
+    assert all(isinstance(resultat, ResultatLot) for resultat in resultats)
+
+def test_resoudre_lot_json(problemes):
+    """Les dictionnaires et les lignes JSON sont décodés, un JSON incorrect est signalé invalide."""
+    import json
+    donnees = problemes[0].vers_dict()
+    resultats = list(resoudre_lot([donnees, json.dumps(donnees), "{pas du json"], jobs=1))
+    assert [resultat.statut for resultat in resultats] == ["resolu", "resolu", "invalide"]
+    assert resultats[1].solution.cout_total == 165
+    assert "JSONDecodeError" in resultats[2].erreur
@@ -0,0 +1,104 @@
+"""Description.
+
+Tests de l'interface en ligne de commande du module __main__.
+"""
+
+import coverage
+import csv
+import json
+import pytest
+from deploiement import (
+    Inf,
+    Couts,
+    Prerequis,
+    Echange,
+    Probleme
+)
+from deploiement.__main__ import main
+
+
+@pytest.fixture
+def probleme():
+    """Problème utilisé pour les tests."""
+    return Probleme(
+        personnel = [
+            Prerequis(mois = "Février", nb_employes_min = 3, nb_employes_max = Inf),
+            Prerequis(mois = "Mars", nb_employes_min = 4, nb_employes_max = Inf),
+            Prerequis(mois = "Avril", nb_employes_min = 2, nb_employes_max = 2)
+        ],
+        echange = Echange(1, 1/2),
+        couts = Couts(90, 100, 300),
+        h_supp = 1/4
+    )
+
+@pytest.fixture
+def entree_jsonl(tmp_path, probleme):
+    """Fichier JSONL : deux problèmes identifiés, une ligne vide et une ligne invalide."""
+    chemin = tmp_path / "problemes.jsonl"
+    lignes = [
+        json.dumps({**probleme.vers_dict(), "id": "a"}),
+        "",
+        "{pas du json",
+        json.dumps(probleme.vers_dict())
+    ]
+    chemin.write_text("\n".join(lignes) + "\n", encoding="utf-8")
+    return chemin
+
+def test_main_jsonl(entree_jsonl, capsys):
+    """Une ligne de résultat par problème, dans l'ordre, avec les identifiants."""
+    assert main([str(entree_jsonl), "--stats"]) == 0
+    sortie = capsys.readouterr()
+    resultats = [json.loads(ligne) for ligne in sortie.out.splitlines()]
+    assert [resultat["id"] for resultat in resultats] == ["a", 1, 2]
+    assert [resultat["statut"] for resultat in resultats] == ["resolu", "invalide", "resolu"]
+    assert resultats[0]["cout_total"] == 165
+    assert resultats[0]["employes"] == [3, 3, 2]
+    assert "Problèmes : 3" in sortie.err
+
+def test_main_csv(tmp_path, capsys):
+    """Entrée et sortie CSV, prérequis séparés par des ';'."""
+    chemin = tmp_path / "problemes.csv"
+    chemin.write_text(
+        "id,personnel,echange,couts,h_supp\n"
+        "x,Février / 3 /;Mars / 4 /;Avril / 2 / 2,1 / .5,90 / 100 / 300,.25\n"
+        "y,Février / 3 /;Mars / 7 / 7,3 / .33,160 / 200 / 200,.25\n",
+        encoding="utf-8"
+    )
+    sortie = tmp_path / "resultats.csv"
+    assert main([str(chemin), "--format", "csv", "-o", str(sortie), "--moteur", "dp"]) == 0
+    with open(sortie, encoding="utf-8", newline="") as fichier:
+        resultats = list(csv.DictReader(fichier))
+    assert [(resultat["id"], resultat["statut"]) for resultat in resultats] == [("x", "resolu"), ("y", "sans_solution")]
+    assert resultats[0]["employes"] == "3;3;2"
+
+def test_main_stdin(probleme, monkeypatch, capsys):
+    """Lecture sur l'entrée standard et profilage sur la sortie d'erreur."""
+    import io
+    monkeypatch.setattr("sys.stdin", io.StringIO(json.dumps(probleme.vers_dict()) + "\n"))
+    assert main(["--profile"]) == 0
+    sortie = capsys.readouterr()
+    assert json.loads(sortie.out)["statut"] == "resolu"
+    assert "cumulative" in sortie.err
+
+def test_main_tube_ferme(entree_jsonl):
+    """Un lecteur qui ferme la sortie avant la fin (| head) arrête le traitement sans trace."""
+    import subprocess
+    import sys
+    from pathlib import Path
+    ligne = entree_jsonl.read_text(encoding="utf-8").splitlines()[0]
+    entree_jsonl.write_text((ligne + "\n") * 20000, encoding="utf-8")
+    processus = subprocess.Popen(
+        [sys.executable, "-m", "deploiement", str(entree_jsonl), "--format", "csv"],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, cwd=Path(__file__).parents[1]
+    )
+    processus.stdout.readline()
+    processus.stdout.close()
+    erreur = processus.stderr.read()
+    processus.wait()
+    assert processus.returncode == 1
+    assert b"Traceback" not in erreur
+
+def test_main_moteur_inconnu(entree_jsonl):
+    """Un moteur inconnu est refusé par argparse."""
+    with pytest.raises(SystemExit):
+        main([str(entree_jsonl), "--moteur", "inconnu"])
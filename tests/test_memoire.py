@@ -0,0 +1,93 @@
+"""Description.
+
+Tests du cache en mémoire des solutions du module memoire.
+"""
+
+import coverage
+import threading
+import time
+import pytest
+from deploiement import (
+    Inf,
+    Couts,
+    Prerequis,
+    Echange,
+    Probleme,
+    GrapheD,
+    Resolution
+)
+from deploiement import moteurs
+from deploiement.memoire import CacheMemoire
+
+
+@pytest.fixture
+def probleme():
+    """Problème utilisé pour les tests."""
+    return Probleme(
+        personnel = [
+            Prerequis(mois = "Février", nb_employes_min = 3, nb_employes_max = Inf),
+            Prerequis(mois = "Mars", nb_employes_min = 4, nb_employes_max = Inf),
+            Prerequis(mois = "Avril", nb_employes_min = 2, nb_employes_max = 2)
+        ],
+        echange = Echange(1, 1/2),
+        couts = Couts(90, 100, 300),
+        h_supp = 1/4
+    )
+
+def test_lru():
+    """Les valeurs les moins récemment utilisées sont oubliées."""
+    cache = CacheMemoire(taille_max = 2)
+    assert cache.resout("a", lambda: 1) == 1
+    assert cache.resout("b", lambda: 2) == 2
+    assert cache.resout("a", lambda: None) == 1
+    cache.resout("c", lambda: 3)
+    assert "a" in cache and "c" in cache and "b" not in cache
+    assert (cache.statistiques.trouvees, cache.statistiques.calculees) == (1, 3)
+    with pytest.raises(ValueError):
+        CacheMemoire(taille_max = 0)
+
+def test_un_seul_calcul():
+    """Des demandes simultanées d'une même clé ne donnent lieu qu'à un calcul."""
+    cache = CacheMemoire()
+    appels = []
+
+    def calcule():
+        appels.append(1)
+        time.sleep(0.05)
+        return object()
+
+    resultats = []
+    fils = [threading.Thread(target=lambda: resultats.append(cache.resout("cle", calcule))) for _ in range(8)]
+    for fil in fils:
+        fil.start()
+    for fil in fils:
+        fil.join()
+    assert len(appels) == 1
+    assert len(resultats) == 8 and all(resultat is resultats[0] for resultat in resultats)
+    assert cache.statistiques.calculees == 1
+    assert cache.statistiques.attendues + cache.statistiques.trouvees == 7
+
+def test_erreur_non_conservee():
+    """Une erreur de calcul est transmise et rien n'est conservé."""
+    cache = CacheMemoire()
+
+    def echoue():
+        raise RuntimeError("échec")
+
+    with pytest.raises(RuntimeError):
+        cache.resout("cle", echoue)
+    assert "cle" not in cache
+    assert cache.resout("cle", lambda: 1) == 1
+
+def test_resolution_partagee(probleme, monkeypatch):
+    """Deux résolutions du même problème partagent la solution du cache."""
+    appels = []
+    moteur = moteurs.MOTEURS["dp"]
+    monkeypatch.setitem(moteurs.MOTEURS, "dp", lambda grapheD: appels.append(1) or moteur(grapheD))
+    cache = CacheMemoire()
+    premiere = Resolution(GrapheD(probleme), cache = cache).solution
+    seconde = Resolution(GrapheD(Probleme(list(probleme.personnel), Echange(1, 1/2), Couts(90, 100, 300), 1/4)), cache = cache).solution
+    assert seconde is premiere
+    assert len(appels) == 1
+    Resolution(GrapheD(probleme), moteur = "dag", cache = cache).solution
+    assert len(cache) == 2
@@ -16,7 +16,8 @@ from deploiement import (
     Probleme,
     GrapheD,
     Sommet,
-    Arrete
+    Arrete,
+    Faisabilite
 )
 
 @pytest.fixture
@@ -204,3 +205,131 @@ def test_sans_arrivee(probleme_non_valide):
     attendu = False
     assert sortie == attendu
 
+
+def test_par_str_mois_compose():
+    """Un mois contenant des espaces doit être correctement découpé."""
+    sortie = Sommet.par_str("Fin d'année - 12")
+    attendu = Sommet("Fin d'année", 12)
+    assert sortie == attendu
+
+def test_genere_couches(probleme):
+    """Les sommets sont représentés par des tableaux d'entiers par mois."""
+    grapheD = GrapheD(probleme = probleme)
+    sortie = [couche.tolist() for couche in grapheD._genere_couches()]
+    attendu = [[3], [2, 3, 4], [1, 2, 3, 4]]
+    assert sortie == attendu
+
+def test_construit_graphe_mois_compose():
+    """Les libellés de mois contenant des espaces ne gênent pas la construction."""
+    probleme = Probleme(
+        personnel = [
+            Prerequis(mois = "Début d'année", nb_employes_min = 2, nb_employes_max = Inf),
+            Prerequis(mois = "Fin d'année", nb_employes_min = 3, nb_employes_max = 3)
+        ],
+        echange = Echange(1, 1/2),
+        couts = Couts(90, 100, 300),
+        h_supp = 1/4
+    )
+    sortie = GrapheD(probleme).construit_graphe()
+    attendu = [
+        ("Début d'année - 2", "Fin d'année - 1", 615.0),
+        ("Début d'année - 2", "Fin d'année - 2", 150.0),
+        ("Début d'année - 2", "Fin d'année - 3", 90.0)
+    ]
+    assert sortie == attendu
+
+def test_faisabilite(probleme):
+    """Propagation des intervalles atteignables mois par mois."""
+    sortie = GrapheD(probleme).faisabilite()
+    assert isinstance(sortie, Faisabilite)
+    assert sortie.resolvable
+    assert sortie.mois_bloquant is None
+    assert sortie.bas.tolist() == [3, 2, 1]
+    assert sortie.haut.tolist() == [3, 4, 4]
+
+def test_faisabilite_sans_arrivee(probleme_non_valide):
+    """Le mois bloquant est signalé."""
+    sortie = GrapheD(probleme_non_valide).faisabilite()
+    assert not sortie.resolvable
+    assert sortie.mois_bloquant == "Mars"
+    assert sortie.bas.tolist() == [3, 2]
+
+def test_contient_arrivee_sans_arretes(probleme, monkeypatch):
+    """Le test de faisabilité ne construit aucune arrête."""
+    grapheD = GrapheD(probleme)
+    monkeypatch.setattr(grapheD, "construit_graphe", None)
+    monkeypatch.setattr(grapheD, "_arretes_couches", None)
+    assert grapheD.contient_arrivee()
+
+def test_intervalles_arriere(probleme):
+    """Intervalles depuis lesquels l'arrivée reste atteignable."""
+    bas, haut = GrapheD(probleme)._intervalles_arriere()
+    assert bas.tolist() == [0, 1, 2]
+    assert haut.tolist() == [4, 4, 2]
+
+def test_intervalles(probleme):
+    """Sans élagage, les intervalles avant ; avec, leur intersection avec les intervalles arrière."""
+    grapheD = GrapheD(probleme)
+    bas, haut = grapheD._intervalles()
+    assert (bas.tolist(), haut.tolist()) == ([3, 2, 1], [3, 4, 4])
+    bas, haut = grapheD._intervalles(elague=True)
+    assert (bas.tolist(), haut.tolist()) == ([3, 2, 2], [3, 4, 2])
+    assert [couche.tolist() for couche in grapheD._genere_couches(elague=True)] == [[3], [2, 3, 4], [2]]
+
+def test_genere_couches_elaguees():
+    """Les sommets ne pouvant plus rejoindre l'arrivée sont retirés."""
+    probleme = Probleme(
+        personnel = [
+            Prerequis(mois = "Février", nb_employes_min = 8, nb_employes_max = Inf),
+            Prerequis(mois = "Mars", nb_employes_min = 12, nb_employes_max = Inf),
+            Prerequis(mois = "Avril", nb_employes_min = 4, nb_employes_max = 4)
+        ],
+        echange = Echange(4, 1/2),
+        couts = Couts(90, 100, 300),
+        h_supp = 1/4
+    )
+    grapheD = GrapheD(probleme)
+    assert [couche.tolist() for couche in grapheD._genere_couches()] == [[8], list(range(4, 13)), list(range(2, 13))]
+    assert [couche.tolist() for couche in grapheD._genere_couches(elague=True)] == [[8], [4, 5, 6, 7, 8], [4]]
+
+def test_arretes_couche(probleme):
+    """Les arrêtes de deux couches consécutives sont produites en tableaux, coûts compris."""
+    grapheD = GrapheD(probleme)
+    couches = grapheD._genere_couches()
+    depart, arrivee, couts = grapheD._arretes_couche(2, couches[1], couches[2])
+    assert depart.tolist() == [2, 2, 2, 3, 3, 3, 4, 4, 4]
+    assert arrivee.tolist() == [1, 2, 3, 2, 3, 4, 2, 3, 4]
+    assert couts.tolist() == [315, 0, 190, 90, 100, 190, 180, 190, 100]
+
+def test_genere_arretes(probleme):
+    """Le flux d'arrêtes redonne construit_graphe, en tuples comme en blocs de tableaux."""
+    grapheD = GrapheD(probleme)
+    flux = grapheD.genere_arretes()
+    assert not isinstance(flux, list)
+    assert list(flux) == grapheD.construit_graphe()
+    blocs = list(grapheD.genere_arretes(par_blocs=True, taille_bloc=4))
+    assert len(blocs) == 4
+    assert [indice_mois for indice_mois, _, _, _ in blocs] == [0, 1, 1, 1]
+    assert sum(len(couts) for _, _, _, couts in blocs) == len(grapheD.construit_graphe())
+    assert [cout for _, _, _, couts in blocs for cout in couts.tolist()] == [cout for _, _, cout in grapheD.construit_graphe()]
+
+def test_exporte_csr(probleme):
+    """Export CSR avec correspondance entre indices et sommets."""
+    pytest.importorskip("scipy")
+    graphe = GrapheD(probleme).exporte_csr()
+    assert graphe.matrice.shape == (8, 8)
+    assert graphe.matrice.nnz == 12
+    assert graphe.mois.tolist() == [0, 1, 1, 1, 2, 2, 2, 2]
+    assert graphe.employes.tolist() == [3, 2, 3, 4, 1, 2, 3, 4]
+    assert graphe.indice(2, 2) == 5
+    assert graphe.matrice[graphe.indice(1, 2), graphe.indice(2, 2)] == 0
+    assert graphe.matrice[graphe.indice(0, 3), graphe.indice(1, 3)] == 75
+    with pytest.raises(ValueError):
+        graphe.indice(1, 7)
+
+def test_exporte_csr_elague(probleme):
+    """L'export élagué ne garde que les sommets menant à l'arrivée."""
+    pytest.importorskip("scipy")
+    graphe = GrapheD(probleme).exporte_csr(elague=True)
+    assert graphe.decalages.tolist() == [0, 1, 4, 5]
+    assert graphe.matrice.nnz == 6
@@ -0,0 +1,234 @@
+"""Description.
+
+Tests des moteurs de résolution du module moteurs.
+"""
+
+import coverage
+import pytest
+import numpy as np
+from deploiement import (
+    Inf,
+    Couts,
+    Prerequis,
+    Echange,
+    Probleme,
+    GrapheD
+)
+from deploiement.moteurs import (
+    _minimums_glissants,
+    passe_avant,
+    passe_arriere,
+    met_a_jour_avant,
+    met_a_jour_arriere,
+    passe_toutes_arrivees,
+    passe_departs,
+    k_meilleurs_chemins,
+    front_pareto,
+    _non_dominees,
+    resout_dp,
+    resout_dag,
+    resout_networkx,
+    resout_scipy,
+    resout_treillis,
+    affine_treillis,
+    _cellules,
+    _divise_cellules
+)
+
+
+@pytest.fixture
+def probleme():
+    """Problème utilisé pour les tests."""
+    return Probleme(
+        personnel = [
+            Prerequis(mois = "Février", nb_employes_min = 3, nb_employes_max = Inf),
+            Prerequis(mois = "Mars", nb_employes_min = 4, nb_employes_max = Inf),
+            Prerequis(mois = "Avril", nb_employes_min = 2, nb_employes_max = 2)
+        ],
+        echange = Echange(1, 1/2),
+        couts = Couts(90, 100, 300),
+        h_supp = 1/4
+    )
+
+@pytest.fixture
+def probleme_sans_solution():
+    """Problème dont l'arrivée n'est pas atteignable."""
+    return Probleme(
+        personnel = [
+            Prerequis(mois = "Février", nb_employes_min = 3, nb_employes_max = Inf),
+            Prerequis(mois = "Mars", nb_employes_min = 7, nb_employes_max = 7)
+        ],
+        echange = Echange(3, 1/3),
+        couts = Couts(160, 200, 200),
+        h_supp = 1/4
+    )
+
+def test_minimums_glissants():
+    """Minimum sur des fenêtres aux bornes croissantes, fenêtre vide comprise."""
+    sortie = _minimums_glissants([4, 2, 5, 1, 3], [0, 0, 2, 4, 5], [1, 2, 3, 4, 4])
+    attendu = ([2, 2, 1, 3, np.inf], [1, 1, 3, 4, -1])
+    assert sortie == attendu
+
+def test_passe_avant(probleme):
+    """Coûts optimaux depuis le départ vers chaque sommet menant à l'arrivée."""
+    tables = passe_avant(GrapheD(probleme))
+    sortie = [valeurs.tolist() for valeurs in tables.valeurs]
+    attendu = [[0], [540, 75, 90], [165]]
+    assert sortie == attendu
+
+def test_passe_arriere(probleme):
+    """Coûts optimaux restants depuis chaque sommet jusqu'à l'arrivée."""
+    tables = passe_arriere(GrapheD(probleme))
+    sortie = [valeurs.tolist() for valeurs in tables.valeurs]
+    attendu = [[165], [0, 90, 180], [0]]
+    assert sortie == attendu
+    assert [choix.tolist() for choix in tables.choix] == [[1], [0, 0, 0], [-1]]
+
+def test_met_a_jour(probleme):
+    """Après modification d'un mois, les tables mises à jour sont celles d'une passe complète."""
+    personnel = list(probleme.personnel)
+    personnel.insert(2, Prerequis("Avril", 3, Inf))
+    personnel[-1] = Prerequis("Mai", 2, 2)
+    grapheD = GrapheD(Probleme(personnel, Echange(1, 1/2), Couts(90, 100, 300), 1/4))
+    tables = passe_avant(grapheD), passe_arriere(grapheD)
+    personnel[2] = Prerequis("Avril", 1, Inf)
+    grapheD = GrapheD(Probleme(personnel, Echange(1, 1/2), Couts(90, 100, 300), 1/4))
+    for mise_a_jour, passe, anciennes in zip((met_a_jour_avant, met_a_jour_arriere), (passe_avant, passe_arriere), tables):
+        attendu = passe(grapheD)
+        sortie = mise_a_jour(grapheD, anciennes, 2)
+        assert [valeurs.tolist() for valeurs in sortie.valeurs] == [valeurs.tolist() for valeurs in attendu.valeurs]
+        assert [choix.tolist() for choix in sortie.choix] == [choix.tolist() for choix in attendu.choix]
+
+def test_passe_toutes_arrivees(probleme):
+    """Coûts optimaux vers chaque nombre d'employés atteignable le dernier mois."""
+    tables = passe_toutes_arrivees(GrapheD(probleme))
+    assert tables.couches[-1].tolist() == [1, 2, 3, 4, 5]
+    assert tables.valeurs[-1].tolist() == [630, 165, 75, 90, 180]
+
+def test_passe_toutes_arrivees_haut(probleme):
+    """Les arrivées sont bornées par haut, et par défaut même avec un ajout maximal démesuré ou flottant."""
+    tables = passe_toutes_arrivees(GrapheD(probleme), haut = 3)
+    assert tables.couches[-1].tolist() == [1, 2, 3]
+    assert tables.valeurs[-1].tolist() == [630, 165, 75]
+    personnel = list(probleme.personnel)
+    for echange in (Echange(10_000_000, 1/2), Echange(1.0, 1/2)):
+        tables = passe_toutes_arrivees(GrapheD(Probleme(personnel, echange, Couts(90, 100, 300), 1/4)))
+        assert tables.couches[-1].dtype.kind == "i"
+        assert all(len(couche) <= 9 for couche in tables.couches)
+
+def test_passe_departs(probleme):
+    """Coûts optimaux depuis chaque départ d'un intervalle, plafond relevé au plus grand départ."""
+    tables = passe_departs(GrapheD(probleme), 2, 5)
+    assert [couche.tolist() for couche in tables.couches] == [[2, 3, 4, 5], [1, 2, 3, 4, 5], [1, 2, 3, 4, 5]]
+    assert tables.valeurs[0].tolist() == [255, 165, 180, 270]
+
+def test_k_meilleurs_chemins(probleme, probleme_sans_solution):
+    """Tous les chemins vers l'arrivée, par coût croissant."""
+    chemins = k_meilleurs_chemins(GrapheD(probleme), 5)
+    assert [chemin.tolist() for chemin in chemins] == [[3, 3, 2], [3, 4, 2], [3, 2, 2]]
+    assert [chemin.tolist() for chemin in k_meilleurs_chemins(GrapheD(probleme), 1)] == [[3, 3, 2]]
+    assert k_meilleurs_chemins(GrapheD(probleme_sans_solution), 5) == []
+
+def test_k_meilleurs_chemins_horizon_long():
+    """L'énumération ne dépend pas de la profondeur de récursion, même sur 1200 périodes."""
+    personnel = [Prerequis(f"P{indice}", 3 + indice % 4, Inf) for indice in range(1199)] + [Prerequis("Fin", 3, 3)]
+    grapheD = GrapheD(Probleme(personnel, Echange(2, 1/2), Couts(90, 100, 300), 1/4))
+    chemins = k_meilleurs_chemins(grapheD, 3)
+    assert len(chemins) == 3 and len(chemins[0]) == 1200
+    assert chemins[0].tolist() == resout_dp(grapheD).tolist()
+
+def test_non_dominees():
+    """Seules les étiquettes non dominées sont gardées, une seule par valeur."""
+    etiquettes = [(5., 2, 4, 0, 0), (3., 3, 4, 1, 0), (4., 3, 5, 2, 0), (3., 3, 4, 3, 0), (6., 1, 4, 4, 0)]
+    assert _non_dominees(etiquettes) == [(3., 3, 4, 1, 0), (5., 2, 4, 0, 0), (6., 1, 4, 4, 0)]
+
+def test_front_pareto(probleme, probleme_sans_solution):
+    """Les chemins [3, 4, 2] et [3, 2, 2] sont dominés par [3, 3, 2]."""
+    chemins = front_pareto(GrapheD(probleme))
+    assert [chemin.tolist() for chemin in chemins] == [[3, 3, 2]]
+    assert front_pareto(GrapheD(probleme_sans_solution)) == []
+
+def test_resout_dp(probleme):
+    """Le moteur linéaire trouve le chemin optimal."""
+    sortie = resout_dp(GrapheD(probleme)).tolist()
+    attendu = [3, 3, 2]
+    assert sortie == attendu
+
+def test_resout_dp_sans_solution(probleme_sans_solution):
+    """Aucun chemin si l'arrivée n'est pas atteignable."""
+    assert resout_dp(GrapheD(probleme_sans_solution)) is None
+
+def test_resout_networkx(probleme):
+    """Le moteur networkx donne le même chemin."""
+    sortie = resout_networkx(GrapheD(probleme)).tolist()
+    attendu = [3, 3, 2]
+    assert sortie == attendu
+
+def test_resout_dag(probleme):
+    """La relaxation couche par couche trouve le chemin optimal."""
+    sortie = resout_dag(GrapheD(probleme)).tolist()
+    attendu = [3, 3, 2]
+    assert sortie == attendu
+
+def test_resout_dag_sans_solution(probleme_sans_solution):
+    """Aucun chemin si l'arrivée n'est pas atteignable."""
+    assert resout_dag(GrapheD(probleme_sans_solution)) is None
+
+def test_resout_scipy(probleme, probleme_sans_solution):
+    """Le moteur scipy donne le même chemin."""
+    pytest.importorskip("scipy")
+    assert resout_scipy(GrapheD(probleme)).tolist() == [3, 3, 2]
+    assert resout_scipy(GrapheD(probleme_sans_solution)) is None
+
+def test_cellules():
+    """Découpage des couches en cellules alignées, puis division par deux."""
+    debuts, fins = _cellules(5, 20, 8)
+    assert debuts.tolist() == [5, 8, 16]
+    assert fins.tolist() == [7, 15, 20]
+    debuts, fins = _divise_cellules(debuts, fins, 4)
+    assert debuts.tolist() == [5, 8, 12, 16, 20]
+    assert fins.tolist() == [7, 11, 15, 19, 20]
+
+def test_resout_treillis(probleme, probleme_sans_solution):
+    """L'affinage du treillis donne le chemin optimal."""
+    assert resout_treillis(GrapheD(probleme)).tolist() == [3, 3, 2]
+    assert resout_treillis(GrapheD(probleme_sans_solution)) is None
+
+def test_affine_treillis_cellules():
+    """Le gain dépend de l'instance : peu de cellules sur des minimums réguliers,
+    à peu près autant que de sommets, à un facteur près, sur des minimums bruités."""
+    def cellules(minimums):
+        grapheD = GrapheD(Probleme(
+            personnel = [Prerequis(f"M{mois}", minimum, Inf) for mois, minimum in enumerate(minimums[:-1])]
+                + [Prerequis("Fin", minimums[-1], minimums[-1])],
+            echange = Echange(500, 1/20),
+            couts = Couts(10, 50, 300),
+            h_supp = 0
+        ))
+        sommets = sum(len(couche) for couche in grapheD._genere_couches(elague=True))
+        return affine_treillis(grapheD)[3] / sommets
+    reguliers = [int(10000 * (1 + np.sin(mois / 4) / 5)) for mois in range(36)]
+    bruites = (10000 * (1 + np.random.default_rng(0).uniform(-.2, .2, 36))).astype(int).tolist()
+    assert cellules(reguliers) < 1 / 20
+    assert cellules(bruites) > 3 * cellules(reguliers)
+
+def test_affine_treillis():
+    """Sur de grands effectifs, le plan est optimal au pas 1 et le minorant encadre le coût optimal avant."""
+    minimums = [int(1000 * (1 + np.sin(mois / 3) / 5)) + 37 * (mois % 3) for mois in range(23)]
+    grapheD = GrapheD(Probleme(
+        personnel = [Prerequis(f"M{mois}", minimum, Inf) for mois, minimum in enumerate(minimums)] + [Prerequis("M23", 1000, 1000)],
+        echange = Echange(100, 1/10),
+        couts = Couts(100, 500, 2000),
+        h_supp = 1/10
+    ))
+    optimum = passe_avant(grapheD).valeurs[-1][-1]
+    chemin, borne_inferieure, pas, cellules = affine_treillis(grapheD, cellules = 4)
+    assert pas == 1
+    assert borne_inferieure == optimum
+    assert cellules < sum(len(couche) for couche in grapheD._genere_couches(elague=True))
+    assert sum(grapheD._cout_arrete(mois, chemin[mois-1], chemin[mois]) for mois in range(1, len(chemin))) == optimum
+    chemin, borne_inferieure, pas, _ = affine_treillis(grapheD, pas_final = 16, cellules = 4)
+    assert pas >= 16
+    assert borne_inferieure <= optimum
+    with pytest.raises(ValueError):
+        affine_treillis(grapheD, pas_final = 0)
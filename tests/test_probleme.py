@@ -13,7 +13,8 @@ from deploiement import (
     Couts,
     Prerequis,
     Echange,
-    Probleme
+    Probleme,
+    ProblemeCompile
 )
 
 @pytest.fixture
@@ -202,4 +203,56 @@ def test_probleme_encodage():
     with pytest.raises(ValueError):
         Probleme.par_str(personnel_str_1, echange_str, couts_str, h_supp_str)
     with pytest.raises(ValueError):
-        Probleme.par_str(personnel_str_2, echange_str, couts_str, h_supp_str)
\ No newline at end of file
+        Probleme.par_str(personnel_str_2, echange_str, couts_str, h_supp_str)
+
+def test_compile(personnel, echange, couts, h_supp):
+    """Compilation du problème en tableaux."""
+    compile = Probleme(personnel, echange, couts, h_supp).compile()
+    assert isinstance(compile, ProblemeCompile)
+    assert compile.mois == ("Février", "Mars", "Avril", "Mai", "Juin")
+    assert compile.indices["Mai"] == 3
+    assert compile.min_pers.tolist() == [3, 4, 7, 7, 5]
+    assert compile.max_pers.tolist() == [Inf, Inf, Inf, Inf, 5]
+    assert compile.plafond == 7
+    assert compile.bas_suppression.tolist() == [0, 1, 2, 3, 3, 4, 5, 5]
+    assert (compile.depart, compile.arrivee) == (3, 5)
+
+def test_compile_unique(personnel, echange, couts, h_supp):
+    """La compilation n'a lieu qu'une fois."""
+    probleme = Probleme(personnel, echange, couts, h_supp)
+    assert probleme.compile() is probleme.compile()
+
+def test_empreinte(personnel, echange, couts, h_supp):
+    """L'empreinte ne dépend que du contenu du problème et le distingue entièrement."""
+    probleme = Probleme(personnel, echange, couts, h_supp)
+    identique = Probleme(personnel, echange, Couts(160.0, 200.0, 200.0), h_supp)
+    different = Probleme(personnel, echange, Couts(170, 200, 200), h_supp)
+    assert probleme.empreinte == identique.empreinte
+    assert probleme.empreinte != different.empreinte
+    assert hash(probleme.compile()) == hash(identique.compile())
+    assert probleme.compile() == identique.compile()
+    assert len({probleme.compile(), identique.compile(), different.compile()}) == 2
+
+def test_vers_dict(personnel, echange, couts, h_supp):
+    """Aller-retour par un dictionnaire sérialisable en JSON."""
+    import json
+    probleme = Probleme(personnel, echange, couts, h_supp)
+    donnees = json.loads(json.dumps(probleme.vers_dict()))
+    assert donnees["personnel"][0] == {"mois": "Février", "nb_employes_min": 3, "nb_employes_max": None}
+    relu = Probleme.par_dict(donnees)
+    assert relu == probleme
+    assert relu.empreinte == probleme.empreinte
+    with pytest.raises(KeyError):
+        Probleme.par_dict({"personnel": []})
+
+def test_par_dict_conversion(personnel, echange, couts, h_supp):
+    """Les champs lus en JSON sont convertis comme dans par_str : un ajout maximal 3.0 devient l'entier 3."""
+    donnees = Probleme(personnel, echange, couts, h_supp).vers_dict()
+    donnees["echange"] = {"ajout_max": 3.0, "suppression_max": "0.25"}
+    donnees["personnel"][-1]["nb_employes_max"] = 5.0
+    probleme = Probleme.par_dict(donnees)
+    assert type(probleme.compile().ajout_max) is int
+    assert probleme == Probleme(personnel, Echange(3, 0.25), couts, h_supp)
+    donnees["echange"]["ajout_max"] = 3.5
+    with pytest.raises(ValueError):
+        Probleme.par_dict(donnees)
@@ -17,8 +17,13 @@ from deploiement import (
     GrapheD,
     Sommet,
     Arrete,
-    Resolution
+    Resolution,
+    Solution,
+    Arrivees,
+    Departs,
+    Encadrement
 )
+from deploiement import moteurs
 
 
 @pytest.fixture
@@ -86,3 +91,172 @@ def test_est_resolvable(probleme, probleme_sans_solution):
     sans_solution = Resolution(GrapheD(probleme_sans_solution))
     assert solution._est_resolvable() == True
     assert sans_solution._est_resolvable() == False
+
+def test_moteur_inconnu(probleme):
+    """Un moteur inconnu doit être refusé."""
+    with pytest.raises(ValueError):
+        Resolution(GrapheD(probleme), moteur = "inconnu")
+
+def test_moteur_dp(probleme):
+    """Le moteur de programmation dynamique donne la même solution."""
+    solution = Resolution(GrapheD(probleme), moteur = "dp")
+    assert solution._trouve_chemin() == ['Février - 3', 'Mars - 3', 'Avril - 2']
+    assert solution._couts_optimaux() == ([0, 75.0, 90], [0, 75.0, 165.0])
+
+def test_solution_unique(probleme, monkeypatch):
+    """Le problème n'est résolu qu'une seule fois pour tous les accesseurs."""
+    appels = []
+    moteur = moteurs.MOTEURS["dp"]
+    monkeypatch.setitem(moteurs.MOTEURS, "dp", lambda grapheD: appels.append(1) or moteur(grapheD))
+    solution = Resolution(GrapheD(probleme))
+    solution._est_resolvable()
+    solution._trouve_chemin()
+    solution._couts_optimaux()
+    solution._bilan()
+    solution.genere_table()
+    assert len(appels) == 1
+
+def test_solution_immuable(probleme):
+    """Le résultat est un objet immuable."""
+    solution = Resolution(GrapheD(probleme)).solution
+    assert isinstance(solution, Solution)
+    assert solution.employes.tolist() == [3, 3, 2]
+    assert solution.cout_total == 165
+    with pytest.raises(ValueError):
+        solution.couts[0] = 1
+    with pytest.raises(AttributeError):
+        solution.employes = None
+
+def test_cout_passage(probleme, probleme_sans_solution):
+    """Coût optimal d'un plan contraint à passer par un sommet."""
+    resolution = Resolution(GrapheD(probleme))
+    employes, couts = resolution.couts_passage("Mars")
+    assert employes.tolist() == [2, 3, 4]
+    assert couts.tolist() == [540, 165, 270]
+    assert resolution.cout_passage("Mars", 4) == 270
+    assert resolution.cout_passage("Mars", 5) == float("inf")
+    assert Resolution(GrapheD(probleme_sans_solution)).cout_passage("Mars", 7) == float("inf")
+    with pytest.raises(ValueError):
+        resolution.cout_passage("Mai", 3)
+
+def test_cout_marginal_min(probleme, probleme_sans_solution):
+    """Coût d'un employé minimum supplémentaire, avec ou sans nouvelle résolution."""
+    resolution = Resolution(GrapheD(probleme))
+    assert resolution.cout_marginal_min("Mars") == 105
+    assert resolution.cout_marginal_min("Avril") == -90
+    assert Resolution(GrapheD(probleme_sans_solution)).cout_marginal_min("Mars") is None
+    personnel = [
+        Prerequis(mois = "Janvier", nb_employes_min = 3, nb_employes_max = Inf),
+        Prerequis(mois = "Février", nb_employes_min = 8, nb_employes_max = Inf),
+        Prerequis(mois = "Mars", nb_employes_min = 4, nb_employes_max = 6),
+        Prerequis(mois = "Avril", nb_employes_min = 7, nb_employes_max = Inf),
+        Prerequis(mois = "Mai", nb_employes_min = 5, nb_employes_max = 5)
+    ]
+    resolution = Resolution(GrapheD(Probleme(personnel, Echange(3, 1/3), Couts(160, 200, 200), 1/4)))
+    personnel[3] = Prerequis(mois = "Avril", nb_employes_min = 8, nb_employes_max = Inf)
+    attendu = Resolution(GrapheD(Probleme(personnel, Echange(3, 1/3), Couts(160, 200, 200), 1/4))).solution.cout_total
+    assert resolution.cout_marginal_min("Avril") == pytest.approx(attendu - resolution.solution.cout_total)
+
+def test_toutes_arrivees(probleme):
+    """Chaque arrivée atteignable a le coût optimal du problème correspondant."""
+    arrivees = Resolution(GrapheD(probleme)).toutes_arrivees()
+    assert isinstance(arrivees, Arrivees)
+    for nb_employes in range(8):
+        personnel = list(probleme.personnel)[:-1] + [Prerequis("Avril", nb_employes, nb_employes)]
+        solution = Resolution(GrapheD(Probleme(personnel, Echange(1, 1/2), Couts(90, 100, 300), 1/4))).solution
+        if solution is None:
+            assert arrivees.cout(nb_employes) == float("inf")
+            assert arrivees.plan(nb_employes) is None
+        else:
+            assert arrivees.cout(nb_employes) == solution.cout_total
+            assert arrivees.plan(nb_employes).tolist() == solution.employes.tolist()
+
+def test_toutes_arrivees_vides():
+    """Sous la plus petite arrivée atteignable, les arrivées sont vides et aucune n'a de plan."""
+    personnel = [Prerequis("Février", 10, Inf), Prerequis("Mars", 12, Inf), Prerequis("Avril", 10, 10)]
+    arrivees = Resolution(GrapheD(Probleme(personnel, Echange(2, 1/10), Couts(90, 100, 300), 0))).toutes_arrivees(8)
+    assert len(arrivees.employes) == 0
+    assert arrivees.cout(8) == float("inf")
+    assert arrivees.plan(8) is None
+
+def test_departs(probleme):
+    """Chaque départ de l'intervalle a le coût optimal du problème correspondant."""
+    departs = Resolution(GrapheD(probleme)).departs(0, 8)
+    assert isinstance(departs, Departs)
+    for nb_employes in range(9):
+        personnel = [Prerequis("Février", nb_employes, Inf)] + list(probleme.personnel)[1:]
+        solution = Resolution(GrapheD(Probleme(personnel, Echange(1, 1/2), Couts(90, 100, 300), 1/4))).solution
+        if solution is None:
+            assert departs.cout(nb_employes) == float("inf")
+            assert departs.plan(nb_employes) is None
+        else:
+            assert departs.cout(nb_employes) == solution.cout_total
+            assert departs.plan(nb_employes)[[0, -1]].tolist() == [nb_employes, 2]
+    with pytest.raises(ValueError):
+        Resolution(GrapheD(probleme)).departs(4, 3)
+
+def test_k_meilleurs(probleme, probleme_sans_solution):
+    """Plans distincts par coût croissant, le premier étant la solution optimale."""
+    resolution = Resolution(GrapheD(probleme))
+    plans = resolution.k_meilleurs(3)
+    assert [plan.cout_total for plan in plans] == [165, 270, 540]
+    assert plans[0].employes.tolist() == resolution.solution.employes.tolist()
+    assert Resolution(GrapheD(probleme_sans_solution)).k_meilleurs(3) == []
+    with pytest.raises(ValueError):
+        resolution.k_meilleurs(0)
+
+def test_front_pareto(probleme_sans_solution):
+    """Compromis entre coût, nombre de changements et effectif maximal."""
+    personnel = [
+        Prerequis(mois = "Janvier", nb_employes_min = 3, nb_employes_max = Inf),
+        Prerequis(mois = "Février", nb_employes_min = 8, nb_employes_max = Inf),
+        Prerequis(mois = "Mars", nb_employes_min = 4, nb_employes_max = 6),
+        Prerequis(mois = "Avril", nb_employes_min = 7, nb_employes_max = Inf),
+        Prerequis(mois = "Mai", nb_employes_min = 5, nb_employes_max = 5)
+    ]
+    front = Resolution(GrapheD(Probleme(personnel, Echange(3, 1/3), Couts(160, 200, 200), 1/4))).front_pareto()
+    assert [(plan.cout_total, plan.changements, plan.pic) for plan in front] == [(740, 4, 6), (820, 2, 5)]
+    assert front[1].employes.tolist() == [3, 5, 5, 5, 5]
+    assert Resolution(GrapheD(probleme_sans_solution)).front_pareto() == []
+
+def test_modifie_min(probleme, monkeypatch):
+    """Chaque modification donne la solution d'une résolution complète du problème modifié."""
+    resolution = Resolution(GrapheD(probleme))
+    for mois, valeur in [("Mars", 2), ("Mars", 6), ("Février", 5), ("Avril", 3), ("Mars", 4)]:
+        resolution = resolution.modifie_min(mois, valeur)
+        probleme_modifie = resolution._grapheD._probleme
+        attendu = Resolution(GrapheD(probleme_modifie)).solution
+        assert resolution.solution.cout_total == attendu.cout_total
+        assert list(probleme_modifie.personnel)[resolution._indice_mois(mois)].nb_employes_min == valeur
+    assert list(probleme_modifie.personnel)[-1].nb_employes_max == 3
+    appels = []
+    relaxe_couche = moteurs._relaxe_couche
+    monkeypatch.setattr(moteurs, "_relaxe_couche", lambda *args, **kwargs: appels.append(args[1]) or relaxe_couche(*args, **kwargs))
+    resolution._tables_sensibilite()
+    appels.clear()
+    assert resolution.modifie_min("Mars", 4).solution.cout_total == resolution.solution.cout_total
+    assert appels == [1]
+    with pytest.raises(ValueError):
+        resolution.modifie_min("Décembre", 3)
+
+def test_modifie_min_maximum():
+    """Un minimum relevé au-dessus du maximum d'un mois intermédiaire relève aussi ce maximum."""
+    personnel = [Prerequis("Février", 10, Inf), Prerequis("Mars", 10, 12), Prerequis("Avril", 11, Inf), Prerequis("Mai", 10, 10)]
+    probleme = Probleme(personnel, Echange(3, 1/4), Couts(90, 100, 300), 0)
+    resolution = Resolution(GrapheD(probleme)).modifie_min("Mars", 13)
+    mars = resolution._grapheD._probleme["Mars"]
+    assert (mars.nb_employes_min, mars.nb_employes_max) == (13, 13)
+    assert resolution.solution.cout_total == Resolution(GrapheD(resolution._grapheD._probleme)).solution.cout_total
+
+def test_encadre(probleme, probleme_sans_solution):
+    """Au pas 1, le plan est prouvé optimal ; sans solution, l'écart est infini."""
+    encadrement = Resolution(GrapheD(probleme)).encadre()
+    assert isinstance(encadrement, Encadrement)
+    assert encadrement.solution.cout_total == encadrement.borne_inferieure == 165
+    assert encadrement.optimal
+    assert encadrement.ecart == 0
+    assert Resolution(GrapheD(probleme), moteur = "treillis").solution.employes.tolist() == [3, 3, 2]
+    sans_solution = Resolution(GrapheD(probleme_sans_solution)).encadre()
+    assert sans_solution.solution is None
+    assert sans_solution.ecart == float("inf")
+    assert not sans_solution.optimal